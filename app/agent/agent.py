@@ -2,17 +2,20 @@
 
 import logging
 import uuid
+from collections.abc import AsyncIterator
+from contextlib import contextmanager
 from contextvars import ContextVar
 
 import httpx
+from fastapi import BackgroundTasks
 from langchain_anthropic import ChatAnthropic
 from langchain_core.language_models import BaseChatModel
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import AIMessageChunk, HumanMessage, SystemMessage
 from langchain_groq import ChatGroq
 from langchain_openai import ChatOpenAI
 from langgraph.prebuilt import create_react_agent
 
-from app.agent.models import DEFAULT_MODEL_ID, ModelSpec, get_model_spec
+from app.agent.models import DEFAULT_MODEL_ID, ModelSpec, get_model_spec, has_provider_key
 from app.agent.prompts import SYSTEM_PROMPT
 from app.agent.skills import Skill, classify_intent
 from app.agent.tools import ALL_TOOLS
@@ -69,111 +72,119 @@ _agent_cache: dict[str, object] = {}
 
 
 def get_agent(model_id: str = DEFAULT_MODEL_ID):
-    if model_id in _agent_cache:
-        return _agent_cache[model_id]
+    # Key by the resolved spec so unknown/empty ids share the default model's compiled graph
     spec = get_model_spec(model_id)
+    if spec.model_id in _agent_cache:
+        return _agent_cache[spec.model_id]
     llm = _create_llm(spec)
     agent = create_react_agent(llm, ALL_TOOLS, prompt=_build_dynamic_prompt)
-    _agent_cache[model_id] = agent
+    _agent_cache[spec.model_id] = agent
     return agent
 
 
-async def run_agent(
-    command: str,
-    model_id: str = DEFAULT_MODEL_ID,
-    ghostfolio_client: GhostfolioClient | None = None,
-    history: list | None = None,
-    user_token: str = "",
-) -> dict:
-    trace_id = str(uuid.uuid4())
-    spec = get_model_spec(model_id)
-    agent = get_agent(model_id)
+def _verify_response(trace_id: str, response: str, tool_outputs: list[str]) -> tuple[dict, dict]:
+    consistency_result = check_numerical_consistency(response, tool_outputs)
+    hallucination_result = check_hallucination(response, tool_outputs)
+    if not consistency_result.get("consistent", True):
+        logger.warning("Trace %s: %s", trace_id, "; ".join(consistency_result["inconsistencies"]))
+    if hallucination_result.get("detected"):
+        logger.warning("Trace %s: unknown tickers cited: %s", trace_id, hallucination_result["unknown_tickers"])
+    return consistency_result, hallucination_result
 
-    # Skill classification
-    skill = classify_intent(command)
 
-    # Memory context
-    memory_ctx = memory_store.build_context(user_token, command) if user_token else ""
+_NO_KEY_MESSAGE = (
+    "The selected model isn't available because its provider has no API key configured. "
+    "Please choose another model."
+)
 
-    # Set per-request context
-    skill_tok = _current_skill.set(skill)
-    memory_tok = _current_memory_context.set(memory_ctx)
 
-    callbacks = []
-    handler = get_langfuse_handler()
-    if handler:
-        callbacks.append(handler)
+def _no_key_result(trace_id: str, spec: ModelSpec) -> dict:
+    return {
+        "response": _NO_KEY_MESSAGE,
+        "trace_id": trace_id,
+        "tools_called": [],
+        "cost_usd": 0,
+        "model": spec.api_model_name,
+        "skill_used": "",
+        "error": "no_api_key",
+        "verification": {},
+    }
 
-    config = {"recursion_limit": settings.max_agent_iterations}
-    if callbacks:
-        config["callbacks"] = callbacks
 
-    client_to_use = ghostfolio_client or _default_client
+def _error_result(trace_id: str, spec: ModelSpec, skill: Skill, e: Exception) -> dict:
+    """Map an exception raised during the agent run to an error result."""
+    result = {
+        "trace_id": trace_id,
+        "tools_called": [],
+        "cost_usd": 0,
+        "model": spec.api_model_name,
+        "skill_used": skill.name,
+        "verification": {},
+    }
+    if isinstance(e, RateLimitError):
+        logger.warning("Rate limited by Ghostfolio API: %s", e)
+        result["response"] = (
+            f"The portfolio service is temporarily rate-limited. Please wait {e.retry_after} seconds and try again."
+        )
+        result["error"] = "rate_limited"
+        result["retry_after"] = e.retry_after
+    elif isinstance(e, httpx.HTTPStatusError) and e.response.status_code == 401:
+        logger.warning("Authentication failed during agent execution")
+        result["response"] = "Your session has expired. Please log in again."
+        result["error"] = "auth_expired"
+    elif isinstance(e, httpx.HTTPStatusError):
+        logger.error("HTTP error during agent execution: %s", e)
+        result["response"] = f"A service error occurred (HTTP {e.response.status_code}). Please try again."
+        result["error"] = str(e)
+    else:
+        logger.error("Agent execution failed: %s", e)
+        result["response"] = "Sorry, I encountered an error processing your request. Please try again."
+        result["error"] = str(e)
+    return result
+
+
+@contextmanager
+def _turn_context(skill: Skill, memory_ctx: str, ghostfolio_client: GhostfolioClient | None):
+    """Set the per-request prompt context and Ghostfolio client for one agent turn."""
+    skill_tok = _current_skill.set(skill)
+    memory_tok = _current_memory_context.set(memory_ctx)
     try:
-        with use_client(client_to_use):
-            try:
-                result = await agent.ainvoke(
-                    {"messages": (history or []) + [HumanMessage(content=command)]},
-                    config=config,
-                )
-            except RateLimitError as e:
-                logger.warning("Rate limited by Ghostfolio API: %s", e)
-                return {
-                    "response": (
-                        f"The portfolio service is temporarily rate-limited. "
-                        f"Please wait {e.retry_after} seconds and try again."
-                    ),
-                    "trace_id": trace_id,
-                    "tools_called": [],
-                    "cost_usd": 0,
-                    "model": spec.api_model_name,
-                    "skill_used": skill.name,
-                    "error": "rate_limited",
-                    "retry_after": e.retry_after,
-                    "verification": {},
-                }
-            except httpx.HTTPStatusError as e:
-                status = e.response.status_code
-                if status == 401:
-                    logger.warning("Authentication failed during agent execution")
-                    return {
-                        "response": "Your session has expired. Please log in again.",
-                        "trace_id": trace_id,
-                        "tools_called": [],
-                        "cost_usd": 0,
-                        "model": spec.api_model_name,
-                        "skill_used": skill.name,
-                        "error": "auth_expired",
-                        "verification": {},
-                    }
-                logger.error("HTTP error during agent execution: %s", e)
-                return {
-                    "response": f"A service error occurred (HTTP {status}). Please try again.",
-                    "trace_id": trace_id,
-                    "tools_called": [],
-                    "cost_usd": 0,
-                    "model": spec.api_model_name,
-                    "skill_used": skill.name,
-                    "error": str(e),
-                    "verification": {},
-                }
-            except Exception as e:
-                logger.error("Agent execution failed: %s", e)
-                return {
-                    "response": "Sorry, I encountered an error processing your request. Please try again.",
-                    "trace_id": trace_id,
-                    "tools_called": [],
-                    "cost_usd": 0,
-                    "model": spec.api_model_name,
-                    "skill_used": skill.name,
-                    "error": str(e),
-                    "verification": {},
-                }
+        with use_client(ghostfolio_client or _default_client):
+            yield
     finally:
         _current_skill.reset(skill_tok)
         _current_memory_context.reset(memory_tok)
 
-    messages = result.get("messages", [])
+
+def _build_config() -> dict:
+    config = {"recursion_limit": settings.max_agent_iterations}
+    handler = get_langfuse_handler()
+    if handler:
+        config["callbacks"] = [handler]
+    return config
+
+
+def _content_text(content: str | list) -> str:
+    """Text of a message's content, which Anthropic sends as a list of content blocks."""
+    if isinstance(content, str):
+        return content
+    return "".join(
+        block if isinstance(block, str) else block.get("text", "")
+        for block in content
+        if isinstance(block, str) or block.get("type") == "text"
+    )
+
+
+def _finalize(
+    messages: list,
+    command: str,
+    trace_id: str,
+    spec: ModelSpec,
+    skill: Skill,
+    user_token: str,
+    background_tasks: BackgroundTasks | None,
+) -> dict:
+    """Post-process the agent's messages: verification, disclaimer, cost and memory."""
     final_message = ""
     tools_called = []
     tool_outputs = []
@@ -181,20 +192,36 @@ async def run_agent(
     total_output = 0
 
     for msg in messages:
-        if hasattr(msg, "type") and msg.type == "tool":
+        msg_type = getattr(msg, "type", None)
+        if msg_type == "tool":
             tools_called.append(msg.name)
             tool_outputs.append(msg.content)
-        if hasattr(msg, "type") and msg.type == "ai" and isinstance(msg.content, str) and msg.content:
-            final_message = msg.content
-        if hasattr(msg, "response_metadata"):
-            usage = msg.response_metadata.get("usage", {})
-            total_input += usage.get("input_tokens", usage.get("prompt_tokens", 0))
-            total_output += usage.get("output_tokens", usage.get("completion_tokens", 0))
+        elif msg_type == "ai":
+            text = _content_text(msg.content)
+            if text:
+                final_message = text
+            # Only model responses carry token usage
+            usage = msg.response_metadata.get("usage")
+            if usage:
+                total_input += usage.get("input_tokens") or usage.get("prompt_tokens", 0)
+                total_output += usage.get("output_tokens") or usage.get("completion_tokens", 0)
 
     # Verification pipeline
-    consistency_result = check_numerical_consistency(final_message, tool_outputs)
-    hallucination_result = check_hallucination(final_message, tool_outputs)
+    verification = {}
+    if not tool_outputs:
+        # Nothing to check the answer against (greetings, follow-ups); report the checks as passed
+        if background_tasks is None:
+            verification["numerical_consistent"] = True
+            verification["hallucination_detected"] = False
+    elif background_tasks is not None:
+        background_tasks.add_task(_verify_response, trace_id, final_message, tool_outputs)
+    else:
+        consistency_result, hallucination_result = _verify_response(trace_id, final_message, tool_outputs)
+        verification["numerical_consistent"] = consistency_result.get("consistent", True)
+        verification["hallucination_detected"] = hallucination_result.get("detected", False)
     risk_warnings = check_risk_thresholds(tool_outputs)
+    verification["risk_warnings"] = risk_warnings
+    verification["disclaimer_injected"] = True
     if risk_warnings:
         final_message += "\n\n" + "\n".join(f"Warning: {w}" for w in risk_warnings)
     final_message = inject_disclaimer(final_message)
@@ -221,10 +248,92 @@ async def run_agent(
         "cost_usd": round(cost, 6),
         "model": spec.api_model_name,
         "skill_used": skill.name,
-        "verification": {
-            "numerical_consistent": consistency_result.get("consistent", True),
-            "hallucination_detected": hallucination_result.get("detected", False),
-            "risk_warnings": risk_warnings,
-            "disclaimer_injected": True,
-        },
+        "verification": verification,
+    }
+
+
+async def run_agent(
+    command: str,
+    model_id: str = DEFAULT_MODEL_ID,
+    ghostfolio_client: GhostfolioClient | None = None,
+    history: list | None = None,
+    user_token: str = "",
+    background_tasks: BackgroundTasks | None = None,
+) -> dict:
+    """Run one agent turn.
+
+    If background_tasks is given, the numerical/hallucination checks run after the
+    response is sent and are only logged; they are omitted from result["verification"].
+    """
+    trace_id = str(uuid.uuid4())
+    spec = get_model_spec(model_id)
+    # Missing keys are the common failure; answer before building the LLM client
+    if not has_provider_key(spec.provider):
+        return _no_key_result(trace_id, spec)
+    agent = get_agent(model_id)
+    skill = classify_intent(command)
+    memory_ctx = memory_store.build_context(user_token, command) if user_token else ""
+
+    try:
+        with _turn_context(skill, memory_ctx, ghostfolio_client):
+            result = await agent.ainvoke(
+                {"messages": (history or []) + [HumanMessage(content=command)]},
+                config=_build_config(),
+            )
+    except Exception as e:
+        return _error_result(trace_id, spec, skill, e)
+
+    return _finalize(result.get("messages", []), command, trace_id, spec, skill, user_token, background_tasks)
+
+
+async def stream_agent(
+    command: str,
+    model_id: str = DEFAULT_MODEL_ID,
+    ghostfolio_client: GhostfolioClient | None = None,
+    history: list | None = None,
+    user_token: str = "",
+    background_tasks: BackgroundTasks | None = None,
+) -> AsyncIterator[dict]:
+    """Run one agent turn, yielding model text as it is generated.
+
+    Yields {"type": "token", "content": ...} events as the model writes and
+    {"type": "tool", "name": ...} events as each tool call finishes, then a single
+    {"type": "done", "result": ...} event carrying the same dict run_agent returns.
+    Streamed text is raw model output; the final response adds warnings and the disclaimer.
+    """
+    trace_id = str(uuid.uuid4())
+    spec = get_model_spec(model_id)
+    if not has_provider_key(spec.provider):
+        yield {"type": "done", "result": _no_key_result(trace_id, spec)}
+        return
+    agent = get_agent(model_id)
+    skill = classify_intent(command)
+    memory_ctx = memory_store.build_context(user_token, command) if user_token else ""
+
+    messages = (history or []) + [HumanMessage(content=command)]
+    seen = len(messages)
+    try:
+        with _turn_context(skill, memory_ctx, ghostfolio_client):
+            async for mode, payload in agent.astream(
+                {"messages": messages},
+                config=_build_config(),
+                stream_mode=["messages", "values"],
+            ):
+                if mode == "values":
+                    messages = payload.get("messages", [])
+                    for msg in messages[seen:]:
+                        if getattr(msg, "type", None) == "tool":
+                            yield {"type": "tool", "name": msg.name}
+                    seen = len(messages)
+                    continue
+                chunk = payload[0]
+                if isinstance(chunk, AIMessageChunk) and (text := _content_text(chunk.content)):
+                    yield {"type": "token", "content": text}
+    except Exception as e:
+        yield {"type": "done", "result": _error_result(trace_id, spec, skill, e)}
+        return
+
+    yield {
+        "type": "done",
+        "result": _finalize(messages, command, trace_id, spec, skill, user_token, background_tasks),
     }
@@ -1,8 +1,11 @@
 """Multi-provider LLM model registry."""
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Literal
 
+from app.config import settings
+
 Provider = Literal["groq", "openai", "anthropic"]
 
 
@@ -55,3 +58,30 @@ DEFAULT_MODEL_ID = "llama-3.3-70b-versatile"
 
 def get_model_spec(model_id: str) -> ModelSpec:
     return SUPPORTED_MODELS.get(model_id, SUPPORTED_MODELS[DEFAULT_MODEL_ID])
+
+
+# Provider keys come from the environment at startup and don't change at runtime
+PROVIDER_KEY_AVAILABLE: dict[str, bool] = {
+    "groq": bool(settings.groq_api_key),
+    "openai": bool(settings.openai_api_key),
+    "anthropic": bool(settings.anthropic_api_key),
+}
+
+
+def has_provider_key(provider: Provider) -> bool:
+    return PROVIDER_KEY_AVAILABLE.get(provider, False)
+
+
+@lru_cache(maxsize=1)
+def available_models() -> tuple[dict, ...]:
+    """Model list for the UI. Provider keys don't change at runtime, so this is built once."""
+    return tuple(
+        {
+            "model_id": spec.model_id,
+            "display_name": spec.display_name,
+            "provider": spec.provider,
+            "is_free": spec.is_free,
+            "available": PROVIDER_KEY_AVAILABLE[spec.provider],
+        }
+        for spec in SUPPORTED_MODELS.values()
+    )
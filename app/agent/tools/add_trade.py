@@ -72,7 +72,7 @@ async def add_trade(
                     f"  Date: {trade_date_display}\n\n"
                     f"Reply 'yes' or 'confirm' to execute this trade."
                 ),
-            }, indent=2)
+            })
 
         # Phase 2: Confirmed — execute the trade
         if not date:
@@ -123,6 +123,6 @@ async def add_trade(
                 f"Successfully added {trade_type} of {quantity} "
                 f"{symbol.upper()} at ${unit_price} (total: ${total_cost:.2f})"
             ),
-        }, indent=2)
+        })
     except Exception as e:
         return json.dumps({"error": str(e)})
@@ -28,6 +28,6 @@ async def dividend_history(symbol: str, data_source: str = "YAHOO") -> str:
                 for d in dividends
             ],
         }
-        return json.dumps(result, indent=2)
+        return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
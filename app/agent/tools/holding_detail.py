@@ -39,6 +39,6 @@ async def holding_detail(symbol: str, data_source: str = "YAHOO") -> str:
             "sectors": detail.get("sectors", []),
             "countries": detail.get("countries", []),
         }
-        return json.dumps(result, indent=2)
+        return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
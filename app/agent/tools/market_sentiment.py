@@ -87,6 +87,6 @@ async def market_sentiment() -> str:
             "risk_flags": risk_flags,
             "diversification_score": "low" if len(risk_flags) >= 3 else "moderate" if risk_flags else "good",
         }
-        return json.dumps(result, indent=2)
+        return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
@@ -34,6 +34,6 @@ async def portfolio_performance(date_range: str = "max") -> str:
             "first_date": chart[0].get("date", "") if chart else "",
             "last_date": chart[-1].get("date", "") if chart else "",
         }
-        return json.dumps(result, indent=2)
+        return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
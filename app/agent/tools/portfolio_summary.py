@@ -54,6 +54,6 @@ async def portfolio_summary() -> str:
                 result["allocation_by_asset_class"].get(ac, 0) + h.get("valueInBaseCurrency", 0), 2
             )
 
-        return json.dumps(result, indent=2)
+        return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
@@ -73,6 +73,6 @@ async def sector_performance(period: str = "1w") -> str:
             "sectors_up": sum(1 for v in sectors.values() if v.get("change_pct", 0) > 0),
             "sectors_down": sum(1 for v in sectors.values() if v.get("change_pct", 0) < 0),
         }
-        return json.dumps(result, indent=2)
+        return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
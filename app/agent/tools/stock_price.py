@@ -37,6 +37,6 @@ async def stock_price(symbol: str) -> str:
             result["day_change"] = round(change, 2)
             result["day_change_pct"] = round(change_pct, 2)
 
-        return json.dumps(result, indent=2)
+        return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": str(e), "symbol": symbol.upper()})
@@ -57,6 +57,6 @@ async def stock_trend(symbol: str, period: str = "1w") -> str:
             "data_points_count": len(data_points),
             "data_points": data_points,
         }
-        return json.dumps(result, indent=2)
+        return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": str(e), "symbol": symbol.upper()})
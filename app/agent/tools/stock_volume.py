@@ -75,6 +75,6 @@ async def stock_volume(symbol: str, period: str = "1w") -> str:
             "total_volume": total_volume,
             "daily_breakdown": daily_volumes,
         }
-        return json.dumps(result, indent=2)
+        return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": str(e), "symbol": symbol.upper()})
@@ -32,6 +32,6 @@ async def symbol_search(query: str) -> str:
                 for item in items[:10]
             ],
         }
-        return json.dumps(result, indent=2)
+        return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
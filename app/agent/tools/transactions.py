@@ -51,6 +51,6 @@ async def transactions(
                 "account_name": act.get("Account", {}).get("name", ""),
             })
 
-        return json.dumps(result, indent=2)
+        return json.dumps(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+from collections import OrderedDict
 from contextlib import contextmanager
 from contextvars import ContextVar
 
@@ -33,6 +34,21 @@ def use_client(client: "GhostfolioClient"):
         _current_client.reset(token)
 
 
+# ── Shared connection pool (token validation, per-request clients) ──
+def _new_shared_http() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+    )
+
+
+_shared_http = _new_shared_http()
+
+
+def _get_shared_http() -> httpx.AsyncClient:
+    return _shared_http
+
+
 class RateLimitError(Exception):
     """Raised when the API returns 429 Too Many Requests."""
 
@@ -45,13 +61,25 @@ class GhostfolioClient:
     MAX_RETRIES = 3
     RETRY_BACKOFF = (1, 2, 4)  # seconds
 
-    def __init__(self, access_token: str | None = None, base_url: str | None = None) -> None:
+    def __init__(
+        self,
+        access_token: str | None = None,
+        base_url: str | None = None,
+        bearer_token: str | None = None,
+        shared_pool: bool = False,
+    ) -> None:
         self._base_url = (base_url or settings.ghostfolio_url).rstrip("/")
         self._access_token = access_token or settings.ghostfolio_access_token
-        self._bearer_token: str | None = None
-        self._client = httpx.AsyncClient(timeout=30.0)
+        self._bearer_token: str | None = bearer_token
+        # Short-lived per-request clients borrow the shared pool so connections outlive the request
+        self._own_http = None if shared_pool else httpx.AsyncClient(timeout=30.0)
         self._auth_lock = asyncio.Lock()
 
+    @property
+    def _client(self) -> httpx.AsyncClient:
+        # Looked up on each use, since close_shared_http() swaps in a fresh pool
+        return self._own_http if self._own_http is not None else _get_shared_http()
+
     async def _authenticate(self) -> str:
         async with self._auth_lock:
             resp = await self._client.post(
@@ -147,35 +175,91 @@ class GhostfolioClient:
         })
 
     async def close(self) -> None:
-        await self._client.aclose()
+        if self._own_http is not None:
+            await self._own_http.aclose()
 
 
 # ── Default singleton (used by FastAPI routes and health checks) ────
 _default_client = GhostfolioClient()
 ghostfolio_client = _default_client
 
+# ── Per-user clients, keyed by access token (LRU) ───────────────────
+# Pooled clients keep their bearer token between chat turns and all share
+# the shared pool, so eviction just drops the reference.
+_client_pool: OrderedDict[str, GhostfolioClient] = OrderedDict()
+MAX_POOLED_CLIENTS = 128
+
+
+def _pool_client(client: GhostfolioClient) -> GhostfolioClient:
+    _client_pool[client._access_token] = client
+    _client_pool.move_to_end(client._access_token)
+    if len(_client_pool) > MAX_POOLED_CLIENTS:
+        _client_pool.popitem(last=False)
+    return client
+
+
+async def get_or_create_client(access_token: str) -> GhostfolioClient:
+    """Return the pooled client for a user token, authenticating it on first use."""
+    client = _client_pool.get(access_token)
+    if client is not None:
+        _client_pool.move_to_end(access_token)
+        return client
+    client = GhostfolioClient(access_token=access_token, shared_pool=True)
+    await client._authenticate()
+    return _pool_client(client)
+
+
+def evict_client(access_token: str) -> None:
+    """Drop a pooled client whose token was rejected, so the next request re-authenticates."""
+    _client_pool.pop(access_token, None)
+
+
+async def validate_access_token(access_token: str, base_url: str | None = None) -> str:
+    """Exchange an access token for a bearer token over the shared connection pool."""
+    url = (base_url or settings.ghostfolio_url).rstrip("/")
+    resp = await _get_shared_http().post(
+        f"{url}/api/v1/auth/anonymous",
+        json={"accessToken": access_token},
+        timeout=10.0,
+    )
+    resp.raise_for_status()
+    return resp.json()["authToken"]
+
+
+async def close_shared_http() -> None:
+    """Close the shared pool and replace it, so a restarted app lifespan still has a usable one."""
+    global _shared_http
+    old, _shared_http = _shared_http, _new_shared_http()
+    await old.aclose()
+
 
 async def create_anonymous_user(base_url: str | None = None) -> dict:
     """Create a new anonymous user on the Ghostfolio instance."""
     url = (base_url or settings.ghostfolio_url).rstrip("/")
     logger.info("Creating new Ghostfolio user at %s/api/v1/user", url)
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        try:
-            resp = await client.post(f"{url}/api/v1/user")
-        except httpx.ConnectError as e:
-            logger.error("Cannot connect to Ghostfolio at %s: %s", url, e)
-            raise RuntimeError(
-                f"Cannot connect to Ghostfolio at {url}. "
-                "Check GHOSTFOLIO_URL env variable."
-            ) from e
-        logger.info("Ghostfolio response: status=%s", resp.status_code)
-        if resp.status_code in (200, 201):
-            data = resp.json()
-            return {
-                "access_token": data.get("accessToken", ""),
-                "auth_token": data.get("authToken", ""),
-            }
+    try:
+        resp = await _get_shared_http().post(f"{url}/api/v1/user", timeout=15.0)
+    except httpx.ConnectError as e:
+        logger.error("Cannot connect to Ghostfolio at %s: %s", url, e)
         raise RuntimeError(
-            f"Failed to create Ghostfolio user: {resp.status_code} {resp.text}. "
-            f"URL: {url}."
-        )
+            f"Cannot connect to Ghostfolio at {url}. "
+            "Check GHOSTFOLIO_URL env variable."
+        ) from e
+    logger.info("Ghostfolio response: status=%s", resp.status_code)
+    if resp.status_code in (200, 201):
+        data = resp.json()
+        access_token = data.get("accessToken", "")
+        auth_token = data.get("authToken", "")
+        if access_token and auth_token:
+            # Signup already authenticated us — pool the client so chat skips /auth/anonymous
+            _pool_client(GhostfolioClient(
+                access_token=access_token, base_url=url, bearer_token=auth_token, shared_pool=True,
+            ))
+        return {
+            "access_token": access_token,
+            "auth_token": auth_token,
+        }
+    raise RuntimeError(
+        f"Failed to create Ghostfolio user: {resp.status_code} {resp.text}. "
+        f"URL: {url}."
+    )
@@ -7,7 +7,7 @@ from fastapi import FastAPI
 from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 
-from app.clients.ghostfolio import ghostfolio_client
+from app.clients.ghostfolio import close_shared_http, ghostfolio_client
 from app.routes.agent_routes import router as agent_router
 from app.routes.chat_routes import router as chat_router
 from app.routes.health import router as health_router
@@ -22,6 +22,7 @@ async def lifespan(app: FastAPI):
     yield
     shutdown_tracing()
     await ghostfolio_client.close()
+    await close_shared_http()
 
 
 app = FastAPI(
@@ -6,6 +6,12 @@ from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
+# Fact TTLs only compare timestamps within this process; tests swap this clock out
+_now = time.monotonic
+
+_TIME_RANGE_RE = re.compile(r"\b(1d|1w|1m|3m|6m|ytd|1y|3y|5y)\b")
+_RISK_TOLERANCE_RE = re.compile(r"\b(conservative|moderate|aggressive)\b")
+
 
 @dataclass
 class UserPreference:
@@ -77,13 +83,13 @@ class MemoryStore:
         self.fact_cache[user_token][tool_name] = CachedFact(
             tool_name=tool_name,
             output=output,
-            cached_at=time.time(),
+            cached_at=_now(),
         )
 
     def get_cached_fact(self, user_token: str, tool_name: str) -> str | None:
         cache = self.fact_cache.get(user_token, {})
         fact = cache.get(tool_name)
-        if fact and (time.time() - fact.cached_at) < self.FACT_TTL_SECONDS:
+        if fact and (_now() - fact.cached_at) < self.FACT_TTL_SECONDS:
             return fact.output
         if fact:
             del cache[tool_name]
@@ -104,7 +110,7 @@ class MemoryStore:
             parts.append("Lessons from previous feedback:\n" + "\n".join(lesson_lines))
 
         cache = self.fact_cache.get(user_token, {})
-        now = time.time()
+        now = _now()
         cached_tools = [
             name for name, fact in cache.items()
             if (now - fact.cached_at) < self.FACT_TTL_SECONDS
@@ -121,11 +127,11 @@ class MemoryStore:
     def extract_preferences(self, user_token: str, query: str, tools_called: list[str]) -> None:
         query_lower = query.lower()
 
-        range_match = re.search(r"\b(1d|1w|1m|3m|6m|ytd|1y|3y|5y)\b", query_lower)
+        range_match = _TIME_RANGE_RE.search(query_lower)
         if range_match and "portfolio_performance" in tools_called:
             self.set_preference(user_token, "preferred_time_range", range_match.group(1))
 
-        risk_match = re.search(r"\b(conservative|moderate|aggressive)\b", query_lower)
+        risk_match = _RISK_TOLERANCE_RE.search(query_lower)
         if risk_match:
             self.set_preference(user_token, "risk_tolerance", risk_match.group(1))
 
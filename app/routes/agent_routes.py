@@ -3,9 +3,8 @@
 from fastapi import APIRouter, Depends, HTTPException
 
 from app.agent.agent import run_agent
-from app.agent.models import DEFAULT_MODEL_ID, SUPPORTED_MODELS
+from app.agent.models import DEFAULT_MODEL_ID, available_models
 from app.auth import require_auth
-from app.config import settings
 from app.models.schemas import AgentCommandRequest, AgentCommandResponse
 
 router = APIRouter()
@@ -34,20 +33,4 @@ async def handle_command(request: AgentCommandRequest, _token: str = Depends(req
 
 @router.get("/models")
 async def list_models():
-    models = []
-    for spec in SUPPORTED_MODELS.values():
-        available = True
-        if spec.provider == "groq" and not settings.groq_api_key:
-            available = False
-        elif spec.provider == "openai" and not settings.openai_api_key:
-            available = False
-        elif spec.provider == "anthropic" and not settings.anthropic_api_key:
-            available = False
-        models.append({
-            "model_id": spec.model_id,
-            "display_name": spec.display_name,
-            "provider": spec.provider,
-            "is_free": spec.is_free,
-            "available": available,
-        })
-    return {"models": models, "default": DEFAULT_MODEL_ID}
+    return {"models": list(available_models()), "default": DEFAULT_MODEL_ID}
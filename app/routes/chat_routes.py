@@ -1,14 +1,22 @@
 """Chat UI API routes — per-user Ghostfolio token auth."""
 
+import json
 import logging
 
-from fastapi import APIRouter, Header, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Header, HTTPException
+from fastapi.responses import StreamingResponse
 from langchain_core.messages import AIMessage, HumanMessage
 
-from app.agent.agent import run_agent
-from app.agent.models import DEFAULT_MODEL_ID, SUPPORTED_MODELS
-from app.clients.ghostfolio import GhostfolioClient, RateLimitError, create_anonymous_user
-from app.config import settings
+from app.agent.agent import run_agent, stream_agent
+from app.agent.models import DEFAULT_MODEL_ID, available_models
+from app.clients.ghostfolio import (
+    GhostfolioClient,
+    RateLimitError,
+    create_anonymous_user,
+    evict_client,
+    get_or_create_client,
+    validate_access_token,
+)
 from app.memory.memory_store import memory_store
 from app.models.schemas import (
     ChatFeedbackRequest,
@@ -25,23 +33,44 @@ from app.tracing.feedback_store import feedback_store
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# ChatMessageItem.role is validated to one of these, so the lookup cannot miss
+_LC_MESSAGE_TYPES = {"user": HumanMessage, "assistant": AIMessage}
+HISTORY_WINDOW = 18
+
 
 async def _get_authenticated_client(token: str) -> GhostfolioClient:
-    """Create and authenticate a GhostfolioClient from a user token."""
-    client = GhostfolioClient(access_token=token)
+    """Return the pooled, authenticated GhostfolioClient for a user token."""
     try:
-        await client._authenticate()
+        return await get_or_create_client(token)
     except Exception as e:
-        await client.close()
         raise HTTPException(status_code=401, detail="Invalid Ghostfolio token") from e
-    return client
+
+
+def _to_lc_history(history: list) -> list:
+    """Convert the most recent chat messages to LangChain messages."""
+    return [_LC_MESSAGE_TYPES[msg.role](content=msg.content) for msg in history[-HISTORY_WINDOW:]]
+
+
+def _to_send_response(result: dict) -> ChatSendResponse:
+    return ChatSendResponse(
+        response=result["response"],
+        tools_called=result.get("tools_called", []),
+        cost_usd=result.get("cost_usd", 0),
+        model=result.get("model", ""),
+        trace_id=result.get("trace_id", ""),
+        skill_used=result.get("skill_used", ""),
+    )
 
 
 @router.post("/login", response_model=ChatLoginResponse)
 async def chat_login(request: ChatLoginRequest):
     """Validate a Ghostfolio access token."""
-    client = await _get_authenticated_client(request.token)
-    await client.close()
+    # Always a real round trip, so a revoked token fails even while its client is pooled
+    try:
+        await validate_access_token(request.token)
+    except Exception as e:
+        evict_client(request.token)
+        raise HTTPException(status_code=401, detail="Invalid Ghostfolio token") from e
     return ChatLoginResponse(success=True, email=request.email)
 
 
@@ -59,36 +88,27 @@ async def chat_signup(request: ChatSignupRequest):
 @router.post("/send", response_model=ChatSendResponse)
 async def chat_send(
     request: ChatSendRequest,
+    background_tasks: BackgroundTasks,
     x_ghostfolio_token: str = Header(..., alias="X-Ghostfolio-Token"),
 ):
     """Send a message to the AI agent."""
     client = await _get_authenticated_client(x_ghostfolio_token)
 
-    # Build LangChain message history
-    lc_history = []
-    for msg in request.history[-18:]:
-        if msg.role == "user":
-            lc_history.append(HumanMessage(content=msg.content))
-        elif msg.role == "assistant":
-            lc_history.append(AIMessage(content=msg.content))
-
     try:
         result = await run_agent(
             command=request.message,
             model_id=request.model_id or DEFAULT_MODEL_ID,
             ghostfolio_client=client,
-            history=lc_history,
+            history=_to_lc_history(request.history),
             user_token=x_ghostfolio_token,
+            background_tasks=background_tasks,
         )
     except RateLimitError as e:
-        await client.close()
         raise HTTPException(
             status_code=429,
             detail=f"Rate limited. Please retry after {e.retry_after} seconds.",
             headers={"Retry-After": str(e.retry_after)},
         ) from e
-    finally:
-        await client.close()
 
     # Forward rate-limit or auth errors detected during agent execution
     error_type = result.get("error", "")
@@ -100,16 +120,46 @@ async def chat_send(
             headers={"Retry-After": str(retry_after)},
         )
     if error_type == "auth_expired":
+        evict_client(x_ghostfolio_token)
         raise HTTPException(status_code=401, detail=result["response"])
 
-    return ChatSendResponse(
-        response=result["response"],
-        tools_called=result.get("tools_called", []),
-        cost_usd=result.get("cost_usd", 0),
-        model=result.get("model", ""),
-        trace_id=result.get("trace_id", ""),
-        skill_used=result.get("skill_used", ""),
-    )
+    return _to_send_response(result)
+
+
+@router.post("/stream")
+async def chat_stream(
+    request: ChatSendRequest,
+    background_tasks: BackgroundTasks,
+    x_ghostfolio_token: str = Header(..., alias="X-Ghostfolio-Token"),
+):
+    """Send a message to the AI agent and stream the answer as NDJSON.
+
+    Emits {"type": "token"} lines while the model writes, then one {"type": "done"} line
+    with the ChatSendResponse fields. Errors found mid-run arrive on the done line as
+    "error" ("rate_limited" / "auth_expired" / other) since the status is already sent.
+    """
+    client = await _get_authenticated_client(x_ghostfolio_token)
+
+    async def events():
+        async for event in stream_agent(
+            command=request.message,
+            model_id=request.model_id or DEFAULT_MODEL_ID,
+            ghostfolio_client=client,
+            history=_to_lc_history(request.history),
+            user_token=x_ghostfolio_token,
+            background_tasks=background_tasks,
+        ):
+            if event["type"] == "done":
+                result = event["result"]
+                event = {"type": "done", **_to_send_response(result).model_dump()}
+                if result.get("error"):
+                    event["error"] = result["error"]
+                    event["retry_after"] = result.get("retry_after")
+                if result.get("error") == "auth_expired":
+                    evict_client(x_ghostfolio_token)
+            yield json.dumps(event) + "\n"
+
+    return StreamingResponse(events(), media_type="application/x-ndjson", background=background_tasks)
 
 
 @router.post("/validate")
@@ -117,14 +167,11 @@ async def chat_validate(
     x_ghostfolio_token: str = Header(..., alias="X-Ghostfolio-Token"),
 ):
     """Validate that a stored token is still valid (called on app load)."""
-    client = GhostfolioClient(access_token=x_ghostfolio_token)
     try:
-        await client._authenticate()
-        return {"valid": True}
+        await validate_access_token(x_ghostfolio_token)
     except Exception:
         raise HTTPException(status_code=401, detail="Token expired or invalid")
-    finally:
-        await client.close()
+    return {"valid": True}
 
 
 @router.post("/feedback")
@@ -176,20 +223,4 @@ async def set_preference(
 @router.get("/models")
 async def chat_models():
     """List available LLM models."""
-    models = []
-    for spec in SUPPORTED_MODELS.values():
-        available = True
-        if spec.provider == "groq" and not settings.groq_api_key:
-            available = False
-        elif spec.provider == "openai" and not settings.openai_api_key:
-            available = False
-        elif spec.provider == "anthropic" and not settings.anthropic_api_key:
-            available = False
-        models.append({
-            "model_id": spec.model_id,
-            "display_name": spec.display_name,
-            "provider": spec.provider,
-            "is_free": spec.is_free,
-            "available": available,
-        })
-    return {"models": models, "default": DEFAULT_MODEL_ID}
+    return {"models": list(available_models()), "default": DEFAULT_MODEL_ID}
@@ -12,37 +12,46 @@ logger = logging.getLogger(__name__)
 
 langfuse_client: Langfuse | None = None
 _tracing_lock = threading.Lock()
+_initialized = False
 
 
 def init_tracing() -> None:
-    global langfuse_client
-
-    # LangSmith: auto-traced by LangChain when env vars are set
-    if settings.langchain_api_key:
-        os.environ["LANGCHAIN_TRACING_V2"] = settings.langchain_tracing_v2
-        os.environ["LANGCHAIN_API_KEY"] = settings.langchain_api_key
-        os.environ["LANGCHAIN_PROJECT"] = settings.langchain_project
-        logger.info("LangSmith tracing enabled (project: %s)", settings.langchain_project)
-    else:
-        os.environ["LANGCHAIN_TRACING_V2"] = "false"
-        logger.info("LangSmith tracing disabled — LANGCHAIN_API_KEY not set")
-
-    # Langfuse: explicit client for callback handler
-    if settings.langfuse_secret_key and settings.langfuse_public_key:
-        with _tracing_lock:
+    global langfuse_client, _initialized
+
+    # Repeat calls (app reloads, tests re-entering the lifespan) reuse the first setup.
+    # The flag is only set once setup succeeds, so a failed attempt can be retried.
+    with _tracing_lock:
+        if _initialized:
+            return
+
+        # LangSmith: auto-traced by LangChain when env vars are set
+        if settings.langchain_api_key:
+            os.environ["LANGCHAIN_TRACING_V2"] = settings.langchain_tracing_v2
+            os.environ["LANGCHAIN_API_KEY"] = settings.langchain_api_key
+            os.environ["LANGCHAIN_PROJECT"] = settings.langchain_project
+            logger.info("LangSmith tracing enabled (project: %s)", settings.langchain_project)
+        else:
+            os.environ["LANGCHAIN_TRACING_V2"] = "false"
+            logger.info("LangSmith tracing disabled — LANGCHAIN_API_KEY not set")
+
+        # Langfuse: explicit client for callback handler
+        if settings.langfuse_secret_key and settings.langfuse_public_key:
             langfuse_client = Langfuse(
                 secret_key=settings.langfuse_secret_key,
                 public_key=settings.langfuse_public_key,
                 host=settings.langfuse_host,
             )
-        logger.info("Langfuse tracing enabled (host: %s)", settings.langfuse_host)
-    else:
-        logger.warning("Langfuse tracing disabled — keys not set")
+            logger.info("Langfuse tracing enabled (host: %s)", settings.langfuse_host)
+        else:
+            logger.warning("Langfuse tracing disabled — keys not set")
+
+        _initialized = True
 
 
 def shutdown_tracing() -> None:
-    global langfuse_client
+    global langfuse_client, _initialized
     with _tracing_lock:
+        _initialized = False
         if langfuse_client:
             langfuse_client.flush()
             langfuse_client.shutdown()
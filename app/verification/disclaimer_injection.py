@@ -10,8 +10,10 @@ DISCLAIMER_TRIGGERS = [
 
 
 def inject_disclaimer(response: str) -> str:
+    # Already present: skip lowercasing and scanning the whole response
+    if FINANCIAL_DISCLAIMER in response:
+        return response
     response_lower = response.lower()
-    needs_disclaimer = any(trigger in response_lower for trigger in DISCLAIMER_TRIGGERS)
-    if needs_disclaimer and FINANCIAL_DISCLAIMER not in response:
+    if any(trigger in response_lower for trigger in DISCLAIMER_TRIGGERS):
         return response + FINANCIAL_DISCLAIMER
     return response
@@ -6,13 +6,27 @@ Usage:
 Requires GHOSTFOLIO_URL and GHOSTFOLIO_ACCESS_TOKEN env vars.
 """
 
+import json
 import os
 import sys
+from collections.abc import Iterator
+from itertools import islice
 
 import httpx
 
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+except ImportError:  # optional speedup; stdlib output is equivalent here
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+
 GHOSTFOLIO_URL = os.environ.get("GHOSTFOLIO_URL", "http://localhost:3333")
 ACCESS_TOKEN = os.environ.get("GHOSTFOLIO_ACCESS_TOKEN", "")
+IMPORT_BATCH_SIZE = 500  # activities per /api/v1/import request
 
 SAMPLE_ORDERS = [
     {"symbol": "VOO", "type": "BUY", "date": "2023-01-15T00:00:00.000Z", "quantity": 100, "unitPrice": 350.00, "fee": 0, "currency": "USD", "dataSource": "YAHOO"},
@@ -23,33 +37,39 @@ SAMPLE_ORDERS = [
 ]
 
 
+def _chunks(seq: list[dict], n: int = IMPORT_BATCH_SIZE) -> Iterator[list[dict]]:
+    it = iter(seq)
+    while batch := list(islice(it, n)):
+        yield batch
+
+
+# Request bodies are encoded once at import; the sample data is static
+_IMPORT_BODIES = [_dumps({"activities": batch}) for batch in _chunks(SAMPLE_ORDERS)]
+
+
 def seed():
     if not ACCESS_TOKEN:
         print("Error: GHOSTFOLIO_ACCESS_TOKEN not set")
         sys.exit(1)
 
-    client = httpx.Client(timeout=30.0)
+    # One keep-alive connection for auth and every import batch
+    with httpx.Client(timeout=30.0, base_url=GHOSTFOLIO_URL) as client:
+        # Authenticate
+        resp = client.post("/api/v1/auth/anonymous", json={"accessToken": ACCESS_TOKEN})
+        resp.raise_for_status()
+        bearer = resp.json()["authToken"]
+        headers = {"Authorization": f"Bearer {bearer}", "Content-Type": "application/json"}
 
-    # Authenticate
-    resp = client.post(f"{GHOSTFOLIO_URL}/api/v1/auth/anonymous", json={"accessToken": ACCESS_TOKEN})
-    resp.raise_for_status()
-    bearer = resp.json()["authToken"]
-    headers = {"Authorization": f"Bearer {bearer}"}
+        print(f"Authenticated with Ghostfolio at {GHOSTFOLIO_URL}")
 
-    print(f"Authenticated with Ghostfolio at {GHOSTFOLIO_URL}")
+        # Import orders
+        for body in _IMPORT_BODIES:
+            resp = client.post("/api/v1/import", content=body, headers=headers)
+            if resp.status_code != 201:
+                print(f"Import failed: {resp.status_code} — {resp.text}")
+                sys.exit(1)
 
-    # Import orders
-    resp = client.post(
-        f"{GHOSTFOLIO_URL}/api/v1/import",
-        json={"activities": SAMPLE_ORDERS},
-        headers=headers,
-    )
-
-    if resp.status_code == 201:
-        print(f"Successfully imported {len(SAMPLE_ORDERS)} orders")
-    else:
-        print(f"Import failed: {resp.status_code} — {resp.text}")
-        sys.exit(1)
+    print(f"Successfully imported {len(SAMPLE_ORDERS)} orders")
 
 
 if __name__ == "__main__":
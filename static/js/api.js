@@ -51,6 +51,49 @@ const api = {
     return _handleResponse(res);
   },
 
+  /**
+   * Stream a reply from /chat/stream. Calls onToken(text) for each model delta and
+   * onTool(name) as each tool finishes; resolves with the final "done" event
+   * (same fields as send()).
+   */
+  async stream(message, modelId, history, token, { onToken, onTool }) {
+    const res = await fetch('/chat/stream', {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+        'X-Ghostfolio-Token': token,
+      },
+      body: JSON.stringify({ message, model_id: modelId, history }),
+    });
+    if (!res.ok) return _handleResponse(res);
+
+    const reader = res.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let done = null;
+    for (;;) {
+      const { value, done: finished } = await reader.read();
+      if (finished) break;
+      buffer += decoder.decode(value, { stream: true });
+      let nl;
+      while ((nl = buffer.indexOf('\n')) >= 0) {
+        const line = buffer.slice(0, nl);
+        buffer = buffer.slice(nl + 1);
+        if (!line) continue;
+        const event = JSON.parse(line);
+        if (event.type === 'token') onToken(event.content);
+        else if (event.type === 'tool') onTool(event.name);
+        else if (event.type === 'done') done = event;
+      }
+    }
+
+    if (!done) throw new ApiError('The response stream ended unexpectedly', 502);
+    // The HTTP status is already 200 by the time these surface; map them like send() does
+    if (done.error === 'rate_limited') throw new ApiError(done.response, 429, done.retry_after || 30);
+    if (done.error === 'auth_expired') throw new ApiError(done.response, 401);
+    return done;
+  },
+
   async feedback(traceId, rating, token, query = '') {
     const res = await fetch('/chat/feedback', {
       method: 'POST',
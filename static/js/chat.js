@@ -6,7 +6,17 @@ const TOOL_ICONS = {
   holding_detail: '🔍', transactions: '💸',
   dividend_history: '💰', symbol_search: '🔎',
   market_sentiment: '⚖️', add_trade: '➕',
+  stock_price: '💲', stock_trend: '📉',
+  sector_performance: '🏭', stock_volume: '📶',
 };
+// Pill markup for the known tools, built once rather than per render
+const TOOL_PILLS = Object.fromEntries(
+  Object.entries(TOOL_ICONS).map(([name, icon]) => [name, `<span class="tool-pill">${icon} ${name}</span>`]),
+);
+
+// Messages kept in localStorage; the server only reads the last CONTEXT_WINDOW
+const MAX_HISTORY = 40;
+const CONTEXT_WINDOW = 18;
 
 const chat = {
   history: [],   // [{role, content, tools?, cost?, traceId?}]
@@ -76,27 +86,46 @@ const chat = {
 
     // Show user message (only if not a retry — retry already has the message shown)
     if (!retryMessage) {
-      chat.history.push({ role: 'user', content: message });
+      chat._pushHistory({ role: 'user', content: message });
       chat._saveHistory();
       chat._renderMessage('user', message);
     }
 
-    // Show typing indicator
+    // Show typing indicator. It is the one placeholder for this turn: the first streamed
+    // event turns it into the reply bubble in place, and the final answer replaces it.
     const typing = chat._showTyping();
+    let streaming = false;
+    const live = () => {
+      if (!streaming) {
+        chat._toStreaming(typing);
+        streaming = true;
+      }
+      return typing;
+    };
 
     try {
-      // Send last 18 messages for context
-      const historySlice = chat.history.slice(-18);
-      const data = await api.send(message, models.getSelected(), historySlice, session.token);
+      // Send the most recent messages for context
+      const historySlice = chat.history.slice(-CONTEXT_WINDOW);
+      const data = await api.stream(message, models.getSelected(), historySlice, session.token, {
+        onToken: (text) => {
+          live().firstChild.append(text);
+          chat._scrollToBottom();
+        },
+        onTool: (name) => {
+          live().lastChild.insertAdjacentHTML('beforeend', chat._toolPill(name));
+          chat._scrollToBottom();
+        },
+      });
 
-      typing.remove();
-      chat.history.push({
+      chat._pushHistory({
         role: 'assistant', content: data.response,
         tools: data.tools_called, cost: data.cost_usd,
         traceId: data.trace_id, skillUsed: data.skill_used,
       });
       chat._saveHistory();
-      chat._renderAssistant(data.response, data.tools_called, data.cost_usd, data.trace_id, data.skill_used);
+      const reply = chat._buildAssistant(data.response, data.tools_called, data.cost_usd, data.trace_id, data.skill_used);
+      typing.replaceWith(reply);
+      chat._scrollToBottom();
     } catch (err) {
       typing.remove();
       chat._lastFailedMessage = message;
@@ -148,14 +177,36 @@ const chat = {
   },
 
   _renderMessage(role, content) {
-    const container = document.getElementById('messages');
+    chat._append(chat._buildMessage(role, content));
+  },
+
+  _buildMessage(role, content) {
     const div = document.createElement('div');
     div.className = `message ${role}`;
     div.innerHTML = role === 'user' ? chat._escapeHtml(content) : chat._md(content);
-    container.appendChild(div);
+    return div;
+  },
+
+  _append(el) {
+    document.getElementById('messages').appendChild(el);
+    chat._scrollToBottom();
+  },
+
+  _scrollToBottom() {
+    const container = document.getElementById('messages');
     container.scrollTop = container.scrollHeight;
   },
 
+  /** Reuse the typing indicator as the live reply bubble: raw text plus tool pills. */
+  _toStreaming(el) {
+    el.className = 'message assistant streaming';
+    el.innerHTML = '<div class="stream-text"></div><div class="tools-bar"></div>';
+  },
+
+  _toolPill(name) {
+    return TOOL_PILLS[name] || `<span class="tool-pill">🔧 ${chat._escapeHtml(name)}</span>`;
+  },
+
   _renderError(text, showRetry, retryMsg) {
     const container = document.getElementById('messages');
     const div = document.createElement('div');
@@ -176,7 +227,10 @@ const chat = {
   },
 
   _renderAssistant(content, tools, cost, traceId, skillUsed) {
-    const container = document.getElementById('messages');
+    chat._append(chat._buildAssistant(content, tools, cost, traceId, skillUsed));
+  },
+
+  _buildAssistant(content, tools, cost, traceId, skillUsed) {
     const wrapper = document.createElement('div');
     wrapper.className = 'message assistant';
     wrapper.innerHTML = chat._md(content);
@@ -184,20 +238,11 @@ const chat = {
     if ((tools && tools.length > 0) || skillUsed) {
       const bar = document.createElement('div');
       bar.className = 'tools-bar';
-      if (skillUsed) {
-        const skillPill = document.createElement('span');
-        skillPill.className = 'tool-pill skill-pill';
-        skillPill.textContent = skillUsed.replace(/_/g, ' ');
-        bar.appendChild(skillPill);
-      }
-      if (tools) {
-        tools.forEach((t) => {
-          const pill = document.createElement('span');
-          pill.className = 'tool-pill';
-          pill.textContent = `${TOOL_ICONS[t] || '🔧'} ${t}`;
-          bar.appendChild(pill);
-        });
-      }
+      // Build every pill as one string so the bar is parsed in a single pass
+      const skillPill = skillUsed
+        ? `<span class="tool-pill skill-pill">${chat._escapeHtml(skillUsed.replace(/_/g, ' '))}</span>`
+        : '';
+      bar.innerHTML = skillPill + (tools || []).map((t) => chat._toolPill(t)).join('');
       wrapper.appendChild(bar);
     }
 
@@ -225,8 +270,7 @@ const chat = {
     }
 
     wrapper.appendChild(meta);
-    container.appendChild(wrapper);
-    container.scrollTop = container.scrollHeight;
+    return wrapper;
   },
 
   async _sendFeedback(btn, traceId) {
@@ -279,6 +323,12 @@ const chat = {
     return `<p>${html}</p>`;
   },
 
+  _pushHistory(item) {
+    chat.history.push(item);
+    // Trim in place so the stored transcript stays bounded
+    if (chat.history.length > MAX_HISTORY) chat.history.splice(0, chat.history.length - MAX_HISTORY);
+  },
+
   _saveHistory() {
     try {
       localStorage.setItem('gf_chat_history', JSON.stringify(chat.history));
@@ -291,14 +341,17 @@ const chat = {
       if (!raw) return;
       const items = JSON.parse(raw);
       if (!Array.isArray(items)) return;
-      chat.history = items;
-      for (const item of items) {
+      chat.history = items.slice(-MAX_HISTORY);
+      // Build the whole transcript off-DOM, then attach and scroll once
+      const frag = document.createDocumentFragment();
+      for (const item of chat.history) {
         if (item.role === 'user') {
-          chat._renderMessage('user', item.content);
+          frag.appendChild(chat._buildMessage('user', item.content));
         } else if (item.role === 'assistant') {
-          chat._renderAssistant(item.content, item.tools, item.cost, item.traceId, item.skillUsed);
+          frag.appendChild(chat._buildAssistant(item.content, item.tools, item.cost, item.traceId, item.skillUsed));
         }
       }
+      chat._append(frag);
     } catch (e) { /* corrupt data — start fresh */ }
   },
 
@@ -2,11 +2,16 @@
  * Model selector management.
  */
 const models = {
+  _loaded: false,
+
   async init() {
+    // The model list is fixed for the server's lifetime; keep the select (and the
+    // user's choice) across logout/login instead of refetching and rebuilding it.
+    if (models._loaded) return;
     const select = document.getElementById('model-select');
     try {
       const data = await api.getModels();
-      select.innerHTML = '';
+      const frag = document.createDocumentFragment();
       data.models.forEach((m) => {
         const opt = document.createElement('option');
         opt.value = m.model_id;
@@ -15,9 +20,12 @@ const models = {
           opt.textContent += ' (no key)';
           opt.disabled = true;
         }
-        if (m.model_id === data.default) opt.selected = true;
-        select.appendChild(opt);
+        frag.appendChild(opt);
       });
+      select.replaceChildren(frag);
+      // Let the select resolve the default by value rather than comparing every option
+      select.value = data.default;
+      models._loaded = true;
     } catch (e) {
       console.error('Failed to load models:', e);
       select.innerHTML = '<option>Failed to load models</option>';
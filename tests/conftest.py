@@ -6,15 +6,28 @@ Mock data matches the REAL Ghostfolio API structure:
 - performance data is nested under 'performance' key
 """
 
+import json
+from types import MappingProxyType
+
 import httpx
 import pytest
 import respx
 
 MOCK_GHOSTFOLIO_URL = "http://localhost:3333"
+JSON_HEADERS = {"content-type": "application/json"}
 
 # ── Mock Data ────────────────────────────────────────────────────────
 
-MOCK_HOLDINGS = {
+# Mock data is frozen only at the top level (MappingProxyType / tuples); nested
+# dicts and lists are still mutable, so tests must not modify what they read.
+# Responses are served from JSON encoded once per session, never these objects.
+# Sector/country breakdowns repeated across holdings share one object each.
+# (Identical string literals are already a single constant per module, so
+# interning them would change nothing.)
+TECH_ONLY = (MappingProxyType({"name": "Technology", "weight": 1.0}),)
+US_ONLY = (MappingProxyType({"name": "United States", "weight": 1.0}),)
+
+MOCK_HOLDINGS = MappingProxyType({
     "VOO": {
         "symbol": "VOO", "name": "Vanguard S&P 500 ETF",
         "valueInBaseCurrency": 50000, "allocationInPercentage": 0.40,
@@ -22,7 +35,7 @@ MOCK_HOLDINGS = {
         "assetClass": "EQUITY", "assetSubClass": "ETF",
         "dataSource": "YAHOO",
         "sectors": [{"name": "Technology", "weight": 0.30}, {"name": "Healthcare", "weight": 0.15}],
-        "countries": [{"name": "United States", "weight": 1.0}],
+        "countries": US_ONLY,
     },
     "AAPL": {
         "symbol": "AAPL", "name": "Apple Inc.",
@@ -30,8 +43,8 @@ MOCK_HOLDINGS = {
         "netPerformancePercent": 0.45,
         "assetClass": "EQUITY", "assetSubClass": "STOCK",
         "dataSource": "YAHOO",
-        "sectors": [{"name": "Technology", "weight": 1.0}],
-        "countries": [{"name": "United States", "weight": 1.0}],
+        "sectors": TECH_ONLY,
+        "countries": US_ONLY,
     },
     "MSFT": {
         "symbol": "MSFT", "name": "Microsoft Corp",
@@ -39,8 +52,8 @@ MOCK_HOLDINGS = {
         "netPerformancePercent": 0.35,
         "assetClass": "EQUITY", "assetSubClass": "STOCK",
         "dataSource": "YAHOO",
-        "sectors": [{"name": "Technology", "weight": 1.0}],
-        "countries": [{"name": "United States", "weight": 1.0}],
+        "sectors": TECH_ONLY,
+        "countries": US_ONLY,
     },
     "BND": {
         "symbol": "BND", "name": "Vanguard Total Bond Market ETF",
@@ -49,11 +62,11 @@ MOCK_HOLDINGS = {
         "assetClass": "FIXED_INCOME", "assetSubClass": "ETF",
         "dataSource": "YAHOO",
         "sectors": [],
-        "countries": [{"name": "United States", "weight": 1.0}],
+        "countries": US_ONLY,
     },
-}
+})
 
-MOCK_SUMMARY = {
+MOCK_SUMMARY = MappingProxyType({
     "currentValueInBaseCurrency": 125000.50,
     "totalInvestment": 100000.00,
     "netPerformance": 25000.50,
@@ -63,9 +76,9 @@ MOCK_SUMMARY = {
     "dividendInBaseCurrency": 1250.00,
     "fees": 45.00,
     "cash": 5000.00,
-}
+})
 
-MOCK_PERFORMANCE = {
+MOCK_PERFORMANCE = MappingProxyType({
     "performance": {
         "grossPerformance": 26000.00,
         "grossPerformancePercent": 0.26,
@@ -82,9 +95,9 @@ MOCK_PERFORMANCE = {
         {"date": "2024-01-01", "value": 100000},
         {"date": "2025-01-01", "value": 125000.50},
     ],
-}
+})
 
-MOCK_HOLDING_AAPL = {
+MOCK_HOLDING_AAPL = MappingProxyType({
     "name": "Apple Inc.",
     "currency": "USD",
     "marketPrice": 195.50,
@@ -100,11 +113,11 @@ MOCK_HOLDING_AAPL = {
     "firstBuyDate": "2023-03-15",
     "assetClass": "EQUITY",
     "assetSubClass": "STOCK",
-    "sectors": [{"name": "Technology", "weight": 1.0}],
-    "countries": [{"name": "United States", "weight": 1.0}],
-}
+    "sectors": TECH_ONLY,
+    "countries": US_ONLY,
+})
 
-MOCK_ORDERS = {
+MOCK_ORDERS = MappingProxyType({
     "activities": [
         {
             "date": "2023-03-15T00:00:00.000Z",
@@ -134,90 +147,119 @@ MOCK_ORDERS = {
             "Account": {"name": "Brokerage"},
         },
     ]
-}
+})
 
-MOCK_ACCOUNTS = {
+MOCK_ACCOUNTS = MappingProxyType({
     "accounts": [
         {"id": "acc-1", "name": "Brokerage", "balance": 5000, "currency": "USD"},
     ]
-}
+})
 
 
-# ── Fixture ──────────────────────────────────────────────────────────
+# ── Fixtures ─────────────────────────────────────────────────────────
 
-@pytest.fixture
-def mock_ghostfolio():
-    with respx.mock(base_url=MOCK_GHOSTFOLIO_URL, assert_all_called=False) as respx_mock:
-        # Auth
-        respx_mock.post("/api/v1/auth/anonymous").mock(
-            return_value=httpx.Response(200, json={"authToken": "mock-jwt-token"})
-        )
+@pytest.fixture(scope="session")
+def ghostfolio_routes() -> tuple[tuple[str, str, str | None, int, bytes], ...]:
+    """Mock Ghostfolio route table: (method, path, route name, status, encoded JSON body).
 
+    The table is static, so it is built and serialized once per session; each test only registers it.
+    """
+    routes = (
+        # Auth
+        ("POST", "/api/v1/auth/anonymous", "auth", 200, {"authToken": "mock-jwt-token"}),
         # Portfolio details (holdings is a DICT keyed by symbol)
-        respx_mock.get("/api/v1/portfolio/details").mock(
-            return_value=httpx.Response(200, json={
-                "summary": MOCK_SUMMARY,
-                "holdings": MOCK_HOLDINGS,
-            })
-        )
-
+        ("GET", "/api/v1/portfolio/details", None, 200, {"summary": MOCK_SUMMARY, "holdings": MOCK_HOLDINGS}),
         # Performance (nested under 'performance' key)
-        respx_mock.get("/api/v2/portfolio/performance").mock(
-            return_value=httpx.Response(200, json=MOCK_PERFORMANCE)
-        )
-
+        ("GET", "/api/v2/portfolio/performance", None, 200, MOCK_PERFORMANCE),
         # Holding detail (AAPL)
-        respx_mock.get("/api/v1/portfolio/holding/YAHOO/AAPL").mock(
-            return_value=httpx.Response(200, json=MOCK_HOLDING_AAPL)
-        )
-
+        ("GET", "/api/v1/portfolio/holding/YAHOO/AAPL", None, 200, MOCK_HOLDING_AAPL),
         # Accounts
-        respx_mock.get("/api/v1/account").mock(
-            return_value=httpx.Response(200, json=MOCK_ACCOUNTS)
-        )
-
+        ("GET", "/api/v1/account", None, 200, MOCK_ACCOUNTS),
         # Orders
-        respx_mock.get("/api/v1/order").mock(
-            return_value=httpx.Response(200, json=MOCK_ORDERS)
-        )
-
+        ("GET", "/api/v1/order", None, 200, MOCK_ORDERS),
         # Symbol lookup
-        respx_mock.get("/api/v1/symbol/lookup").mock(
-            return_value=httpx.Response(200, json={
-                "items": [
-                    {
-                        "symbol": "AAPL",
-                        "name": "Apple Inc.",
-                        "dataSource": "YAHOO",
-                        "assetClass": "EQUITY",
-                        "assetSubClass": "STOCK",
-                        "currency": "USD",
-                    }
-                ]
-            })
-        )
-
+        ("GET", "/api/v1/symbol/lookup", None, 200, {
+            "items": [
+                {
+                    "symbol": "AAPL",
+                    "name": "Apple Inc.",
+                    "dataSource": "YAHOO",
+                    "assetClass": "EQUITY",
+                    "assetSubClass": "STOCK",
+                    "currency": "USD",
+                }
+            ]
+        }),
         # Dividends
-        respx_mock.get("/api/v1/portfolio/dividends/YAHOO/VOO").mock(
-            return_value=httpx.Response(200, json={
-                "dividends": [
-                    {"date": "2024-03-15", "amount": 150.00},
-                    {"date": "2024-06-15", "amount": 160.00},
-                    {"date": "2024-09-15", "amount": 155.00},
-                    {"date": "2024-12-15", "amount": 165.00},
-                ]
-            })
-        )
-
+        ("GET", "/api/v1/portfolio/dividends/YAHOO/VOO", None, 200, {
+            "dividends": [
+                {"date": "2024-03-15", "amount": 150.00},
+                {"date": "2024-06-15", "amount": 160.00},
+                {"date": "2024-09-15", "amount": 155.00},
+                {"date": "2024-12-15", "amount": 165.00},
+            ]
+        }),
         # Create order
-        respx_mock.post("/api/v1/order").mock(
-            return_value=httpx.Response(201, json={
-                "id": "order-new-1",
-                "type": "BUY",
-                "symbol": "TSLA",
-                "quantity": 5,
-                "unitPrice": 250,
-            })
+        ("POST", "/api/v1/order", None, 201, {
+            "id": "order-new-1",
+            "type": "BUY",
+            "symbol": "TSLA",
+            "quantity": 5,
+            "unitPrice": 250,
+        }),
+    )
+    # default=dict lets json encode the read-only MappingProxyType mock data
+    return tuple(
+        (method, path, name, status, json.dumps(body, default=dict).encode())
+        for method, path, name, status, body in routes
+    )
+
+
+@pytest.fixture(scope="session")
+def ghostfolio_router(ghostfolio_routes) -> respx.MockRouter:
+    """Mock Ghostfolio router with every route registered, built once per session.
+
+    The router is not started here; mock_ghostfolio activates it per test.
+    """
+    router = respx.mock(base_url=MOCK_GHOSTFOLIO_URL, assert_all_called=False)
+    for method, path, name, status, body in ghostfolio_routes:
+        router.route(method=method, path=path, name=name).mock(
+            return_value=httpx.Response(status, content=body, headers=JSON_HEADERS)
         )
+    return router
+
+
+@pytest.fixture
+def mock_ghostfolio(ghostfolio_router):
+    # Entering snapshots the routes; exiting rolls back routes a test added and clears call stats
+    with ghostfolio_router:
+        yield ghostfolio_router
+
+
+@pytest.fixture(scope="session")
+def fake_hist_frames() -> MappingProxyType:
+    """Canned yfinance history frames for the market tool tests, keyed by name.
+
+    The tools only read these frames, so one set is built per session and shared.
+    """
+    import pandas as pd
 
-        yield respx_mock
+    # The weekly and 5-day volume frames cover the same days; share one index
+    week = pd.date_range("2025-02-24", periods=5, freq="D")
+    return MappingProxyType({
+        "weekly": pd.DataFrame({
+            "Close": [100.0, 102.0, 101.0, 103.0, 105.0],
+            "Volume": [1000, 1200, 900, 1100, 1500],
+        }, index=week),
+        "empty": pd.DataFrame(),
+        "vol_5d": pd.DataFrame({
+            "Open": [100, 102, 101, 103, 104],
+            "Close": [102, 101, 103, 104, 106],
+            "Volume": [1000000, 1200000, 900000, 1100000, 1500000],
+        }, index=week),
+        "vol_30d": pd.DataFrame({
+            "Open": [100] * 20,
+            "Close": [102] * 20,
+            "Volume": [1000000] * 20,
+        }, index=pd.date_range("2025-02-01", periods=20, freq="D")),
+    })
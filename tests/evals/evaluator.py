@@ -11,10 +11,15 @@ Check types:
 
 from __future__ import annotations
 
+import re
+import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
 
+_SEP = "=" * 60
 
-@dataclass
+
+@dataclass(slots=True)
 class EvalResult:
     """Result of evaluating a single test case."""
 
@@ -34,6 +39,44 @@ class EvalResult:
         return f"[{status}] {self.case_id}"
 
 
+@lru_cache(maxsize=256)
+def _phrase_scanner(phrases: tuple[str, ...]) -> re.Pattern:
+    # Zero-width lookahead tries every start position, longest phrase first
+    alternatives = "|".join(re.escape(p) for p in sorted(phrases, key=len, reverse=True))
+    return re.compile(f"(?=({alternatives}))", re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
+def _lowered_phrases(
+    must_contain: tuple[str, ...],
+    must_not_contain: tuple[str, ...],
+    must_contain_any: tuple[str, ...],
+) -> tuple[frozenset[str], frozenset[str], frozenset[str], tuple[str, ...]]:
+    """Lowercase a case's phrase lists once, as sets, plus a tuple of every unique phrase."""
+    contain = tuple(p.lower() for p in must_contain)
+    not_contain = tuple(p.lower() for p in must_not_contain)
+    contain_any = tuple(p.lower() for p in must_contain_any)
+    return (
+        frozenset(contain),
+        frozenset(not_contain),
+        frozenset(contain_any),
+        tuple(dict.fromkeys((*contain, *not_contain, *contain_any))),
+    )
+
+
+def _found_phrases(text: str, phrases: tuple[str, ...]) -> set[str]:
+    """Return which lowercased phrases occur in text, ignoring case, in one scan.
+
+    The scan reports the longest phrase starting at each position; any shorter phrase
+    starting there is a prefix of it, so it is recovered with a containment check.
+    Only the (short) matches are lowercased, never the whole response.
+    """
+    if not phrases:
+        return set()
+    matches = {m.lower() for m in _phrase_scanner(phrases).findall(text)}
+    return {p for p in phrases if any(p in m for m in matches)}
+
+
 def evaluate_case(
     case: dict,
     response_text: str,
@@ -51,42 +94,58 @@ def evaluate_case(
     """
     case_id = case["id"]
     failures: list[str] = []
-    response_lower = response_text.lower()
+
+    must_contain = case.get("must_contain", [])
+    must_not_contain = case.get("must_not_contain", [])
+    must_contain_any = case.get("must_contain_any", [])
+    # Cases are static, so repeat evaluations reuse the lowered phrases
+    must_contain_lc, must_not_contain_lc, must_contain_any_lc, all_phrases = _lowered_phrases(
+        tuple(must_contain), tuple(must_not_contain), tuple(must_contain_any)
+    )
+    # One pass over the response for every phrase this case checks
+    found = _found_phrases(response_text, all_phrases)
 
     # ── Tool Selection ───────────────────────────────────────────
+    # Each check is a set operation; failure messages are only built for what failed,
+    # in the case's own phrase order
     tool_check_passed = None
     expected_tools = case.get("expected_tools", [])
     if expected_tools:
-        for tool in expected_tools:
-            if tool not in tools_called:
-                failures.append(f"Tool selection: expected '{tool}' but got {tools_called}")
-        tool_check_passed = len(failures) == 0
+        missing_tools = set(expected_tools).difference(tools_called)
+        if missing_tools:
+            failures.extend(
+                f"Tool selection: expected '{tool}' but got {tools_called}"
+                for tool in expected_tools
+                if tool in missing_tools
+            )
+        tool_check_passed = not missing_tools
 
     # ── Content Validation (must_contain) ────────────────────────
     content_check_passed = None
-    must_contain = case.get("must_contain", [])
     if must_contain:
-        pre_fail_count = len(failures)
-        for phrase in must_contain:
-            if phrase.lower() not in response_lower:
-                failures.append(f"Content: response missing '{phrase}'")
-        content_check_passed = len(failures) == pre_fail_count
+        missing = must_contain_lc - found
+        if missing:
+            failures.extend(
+                f"Content: response missing '{phrase}'" for phrase in must_contain if phrase.lower() in missing
+            )
+        content_check_passed = not missing
 
     # ── Negative Validation (must_not_contain) ───────────────────
     negative_check_passed = None
-    must_not_contain = case.get("must_not_contain", [])
     if must_not_contain:
-        pre_fail_count = len(failures)
-        for phrase in must_not_contain:
-            if phrase.lower() in response_lower:
-                failures.append(f"Negative: response contains forbidden '{phrase}'")
-        negative_check_passed = len(failures) == pre_fail_count
+        forbidden = must_not_contain_lc & found
+        if forbidden:
+            failures.extend(
+                f"Negative: response contains forbidden '{phrase}'"
+                for phrase in must_not_contain
+                if phrase.lower() in forbidden
+            )
+        negative_check_passed = not forbidden
 
     # ── Contain-Any Validation (must_contain_any) ────────────────
     contain_any_check_passed = None
-    must_contain_any = case.get("must_contain_any", [])
     if must_contain_any:
-        found_any = any(phrase.lower() in response_lower for phrase in must_contain_any)
+        found_any = not must_contain_any_lc.isdisjoint(found)
         if not found_any:
             failures.append(
                 f"ContainAny: response must contain at least one of {must_contain_any}"
@@ -134,20 +193,19 @@ def evaluate_batch(
 def print_eval_report(eval_results: list[EvalResult]) -> None:
     """Print a formatted eval report to stdout."""
     total = len(eval_results)
-    passed = sum(1 for r in eval_results if r.passed)
+    passed = sum(r.passed for r in eval_results)
     failed = total - passed
 
-    print("\n" + "=" * 60)
-    print(f"  EVAL REPORT: {passed}/{total} passed, {failed} failed")
-    print("=" * 60)
-
-    for r in eval_results:
-        print(r.summary)
-
+    # Build the whole report, then write it in one call
+    lines = [
+        "",
+        _SEP,
+        f"  EVAL REPORT: {passed}/{total} passed, {failed} failed",
+        _SEP,
+        *(r.summary for r in eval_results),
+    ]
     if failed > 0:
-        print(f"\n  FAILURES: {failed}/{total}")
-        for r in eval_results:
-            if not r.passed:
-                for f in r.failures:
-                    print(f"    - [{r.case_id}] {f}")
-    print("=" * 60 + "\n")
+        lines.append(f"\n  FAILURES: {failed}/{total}")
+        lines.extend(f"    - [{r.case_id}] {f}" for r in eval_results if not r.passed for f in r.failures)
+    lines.append(_SEP + "\n")
+    sys.stdout.write("\n".join(lines) + "\n")
@@ -0,0 +1,75 @@
+"""Field-by-field checks for the table-driven tool and client tests.
+
+Each case maps a dotted path in the parsed tool output ("top_holdings.0.symbol")
+to an expected value, or to one of the matchers below when equality is too strict.
+Every field is asserted on its own, so a failure names the field that was wrong.
+"""
+
+
+class AtLeast:
+    def __init__(self, minimum):
+        self.minimum = minimum
+
+    def __eq__(self, other):
+        return other >= self.minimum
+
+    def __repr__(self):
+        return f"AtLeast({self.minimum!r})"
+
+
+class Contains:
+    """Matches a dict with the given key or a list with the given item."""
+
+    def __init__(self, item):
+        self.item = item
+
+    def __eq__(self, other):
+        return self.item in other
+
+    def __repr__(self):
+        return f"Contains({self.item!r})"
+
+
+class HasItem:
+    """Matches a list holding at least one dict with all the given fields."""
+
+    def __init__(self, **fields):
+        self.fields = fields
+
+    def __eq__(self, other):
+        return any(all(item.get(k) == v for k, v in self.fields.items()) for item in other)
+
+    def __repr__(self):
+        return f"HasItem({self.fields!r})"
+
+
+class Len:
+    def __init__(self, length):
+        self.length = length
+
+    def __eq__(self, other):
+        return len(other) == self.length
+
+    def __repr__(self):
+        return f"Len({self.length!r})"
+
+
+class NonEmpty:
+    def __eq__(self, other):
+        return len(other) > 0
+
+    def __repr__(self):
+        return "NonEmpty()"
+
+
+def lookup(data, path: str):
+    """Follow a dotted path through dicts and lists ("accounts.0.name")."""
+    for key in path.split("."):
+        data = data[int(key)] if isinstance(data, list) else data[key]
+    return data
+
+
+def assert_fields(result: dict, expected: dict) -> None:
+    for path, want in expected.items():
+        got = lookup(result, path)
+        assert got == want, f"{path}: got {got!r}, expected {want!r}"
@@ -10,15 +10,25 @@ Reserve LLM judges for what can't be checked programmatically.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import re
 from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
 
-import yaml
+from tests.evals.yaml_cache import load_cached_yaml
 
 logger = logging.getLogger(__name__)
 
-GROUNDEDNESS_PROMPT = """You are a fact-checking judge. Your job is to determine if the agent's
+# Max judge calls in flight at once in judge_batch (keeps Groq's rate limit happy)
+JUDGE_CONCURRENCY = 4
+
+
+def _groundedness_prompt(tool_output: str, response: str) -> str:
+    # f-string builder: compiled once, no template parsing per judge call
+    return f"""You are a fact-checking judge. Your job is to determine if the agent's
 response is grounded in the tool output data.
 
 TOOL OUTPUT (source of truth):
@@ -47,7 +57,9 @@ Rules:
 - If the response fabricates ANY number not in the tool output, overall_grounded must be false.
 """
 
-RUBRIC_PROMPT = """You are a quality judge evaluating an AI finance assistant's response.
+
+def _rubric_prompt(query: str, tool_output: str, response: str, rubric_text: str) -> str:
+    return f"""You are a quality judge evaluating an AI finance assistant's response.
 
 USER QUERY: {query}
 TOOL OUTPUT (ground truth): {tool_output}
@@ -76,7 +88,27 @@ IMPORTANT:
 """
 
 
-@dataclass
+_DECODER = json.JSONDecoder()
+
+# Fixups for malformed judge JSON: trailing commas, then bare score extraction
+_RE_TRAIL_OBJ = re.compile(r",\s*}")
+_RE_TRAIL_ARR = re.compile(r",\s*]")
+_RE_SCORE = re.compile(r'"(\w+)":\s*\{\s*"score":\s*(\d)')
+
+
+def _decode_embedded_json(content: str) -> dict | None:
+    """Decode the first JSON object in LLM output, ignoring any text around it.
+
+    Returns None if there is no object; raises json.JSONDecodeError if it is malformed.
+    """
+    start = content.find("{")
+    if start < 0:
+        return None
+    parsed, _ = _DECODER.raw_decode(content, start)
+    return parsed
+
+
+@dataclass(slots=True)
 class GroundednessResult:
     overall_grounded: bool
     groundedness_score: float
@@ -84,7 +116,7 @@ class GroundednessResult:
     raw_response: str
 
 
-@dataclass
+@dataclass(slots=True)
 class RubricResult:
     scores: dict[str, dict]
     weighted_score: float
@@ -92,13 +124,29 @@ class RubricResult:
     raw_response: str
 
 
+@cache
+def _default_llm():
+    """Groq Llama judge, shared across calls so its HTTP connection pool stays warm."""
+    from langchain_groq import ChatGroq
+
+    from app.config import settings
+
+    return ChatGroq(
+        model="llama-3.3-70b-versatile",
+        temperature=0,
+        api_key=settings.groq_api_key,
+    )
+
+
+@cache
 def _load_rubrics() -> dict:
-    """Load rubric definitions from YAML."""
-    import os
+    """Load rubric definitions from YAML (once; callers must not mutate the result)."""
+    return load_cached_yaml(Path(__file__).parent / "rubrics.yaml")
 
-    rubric_path = os.path.join(os.path.dirname(__file__), "rubrics.yaml")
-    with open(rubric_path) as f:
-        return yaml.safe_load(f)
+
+@cache
+def _rubric_text() -> str:
+    return _format_rubric_text(_load_rubrics())
 
 
 def _format_rubric_text(rubrics: dict) -> str:
@@ -127,34 +175,18 @@ async def judge_groundedness(
     Returns:
         GroundednessResult with claim-level and overall assessment.
     """
-    if llm is None:
-        from langchain_groq import ChatGroq
-
-        from app.config import settings
-
-        llm = ChatGroq(
-            model="llama-3.3-70b-versatile",
-            temperature=0,
-            api_key=settings.groq_api_key,
-        )
+    llm = llm or _default_llm()
 
     combined_output = "\n---\n".join(tool_outputs) if tool_outputs else "(no tool output)"
 
-    prompt = GROUNDEDNESS_PROMPT.format(
-        tool_output=combined_output,
-        response=response,
-    )
+    prompt = _groundedness_prompt(tool_output=combined_output, response=response)
 
     try:
         result = await llm.ainvoke(prompt)
         content = result.content
 
-        # Parse JSON from response
-        json_start = content.find("{")
-        json_end = content.rfind("}") + 1
-        if json_start >= 0 and json_end > json_start:
-            parsed = json.loads(content[json_start:json_end])
-        else:
+        parsed = _decode_embedded_json(content)
+        if parsed is None:
             parsed = {"overall_grounded": False, "groundedness_score": 0, "claims": []}
 
         return GroundednessResult(
@@ -190,22 +222,13 @@ async def judge_rubric(
     Returns:
         RubricResult with per-dimension scores and weighted total.
     """
-    if llm is None:
-        from langchain_groq import ChatGroq
-
-        from app.config import settings
-
-        llm = ChatGroq(
-            model="llama-3.3-70b-versatile",
-            temperature=0,
-            api_key=settings.groq_api_key,
-        )
+    llm = llm or _default_llm()
 
     rubrics = _load_rubrics()
-    rubric_text = _format_rubric_text(rubrics)
+    rubric_text = _rubric_text()
     combined_output = "\n---\n".join(tool_outputs) if tool_outputs else "(no tool output)"
 
-    prompt = RUBRIC_PROMPT.format(
+    prompt = _rubric_prompt(
         query=query,
         tool_output=combined_output,
         response=response,
@@ -217,32 +240,25 @@ async def judge_rubric(
         content = result.content
 
         # Try to parse JSON, with fallback for malformed LLM output
-        parsed = None
-        json_start = content.find("{")
-        json_end = content.rfind("}") + 1
-        if json_start >= 0 and json_end > json_start:
-            raw_json = content[json_start:json_end]
+        try:
+            parsed = _decode_embedded_json(content)
+        except json.JSONDecodeError:
+            parsed = None
+            raw_json = content[content.find("{") : content.rfind("}") + 1]
+            # Try fixing common LLM JSON issues (trailing commas, etc.)
+            fixed = _RE_TRAIL_ARR.sub("]", _RE_TRAIL_OBJ.sub("}", raw_json))
             try:
-                parsed = json.loads(raw_json)
+                parsed = json.loads(fixed)
             except json.JSONDecodeError:
-                # Try fixing common LLM JSON issues (trailing commas, etc.)
-                import re
-
-                fixed = re.sub(r",\s*}", "}", raw_json)
-                fixed = re.sub(r",\s*]", "]", fixed)
-                try:
-                    parsed = json.loads(fixed)
-                except json.JSONDecodeError:
-                    # Last resort: extract scores with regex
-                    score_pattern = r'"(\w+)":\s*\{\s*"score":\s*(\d)'
-                    matches = re.findall(score_pattern, raw_json)
-                    if matches:
-                        parsed = {
-                            "scores": {
-                                name: {"score": int(score), "reason": "extracted via regex"}
-                                for name, score in matches
-                            }
+                # Last resort: extract scores with regex
+                matches = _RE_SCORE.findall(raw_json)
+                if matches:
+                    parsed = {
+                        "scores": {
+                            name: {"score": int(score), "reason": "extracted via regex"}
+                            for name, score in matches
                         }
+                    }
         if parsed is None:
             parsed = {"scores": {}, "weighted_score": 0, "quality_level": "critical"}
 
@@ -278,3 +294,34 @@ async def judge_rubric(
             quality_level="critical",
             raw_response=str(e),
         )
+
+
+async def judge_batch(
+    cases: list[dict],
+    results: list[dict],
+    tool_outputs_list: list[list[str]],
+    llm=None,
+    concurrency: int = JUDGE_CONCURRENCY,
+) -> list[RubricResult]:
+    """Rubric-score a batch of agent results concurrently.
+
+    Args:
+        cases: Test case dicts with a 'query' key.
+        results: Agent result dicts with a 'response' key.
+        tool_outputs_list: Raw tool output strings for each result.
+        llm: LangChain LLM to use as judge, shared by every call.
+        concurrency: Maximum number of judge calls in flight.
+
+    Returns:
+        RubricResult per case, in input order.
+    """
+    llm = llm or _default_llm()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def judge_one(case: dict, result: dict, tool_outputs: list[str]) -> RubricResult:
+        async with semaphore:
+            return await judge_rubric(case["query"], result.get("response", ""), tool_outputs, llm=llm)
+
+    return await asyncio.gather(
+        *(judge_one(case, result, outputs) for case, result, outputs in zip(cases, results, tool_outputs_list))
+    )
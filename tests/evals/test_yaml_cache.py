@@ -0,0 +1,38 @@
+"""Test the parsed-YAML cache falls back to the YAML file when the cache is unusable."""
+
+import os
+import pickle
+
+import pytest
+
+from tests.evals.yaml_cache import _cache_path, load_cached_yaml
+
+
+@pytest.fixture
+def yaml_file(tmp_path):
+    path = tmp_path / "cases.yaml"
+    path.write_text("- id: a\n")
+    return path
+
+
+@pytest.mark.parametrize("payload", [
+    b"",  # truncated
+    b"not a pickle",
+    pickle.dumps({"some": "dict"}),  # wrong shape
+    pickle.dumps(("one", "two", "three")),
+])
+def test_unusable_cache_is_rebuilt(yaml_file, payload):
+    cache = _cache_path(yaml_file)
+    cache.parent.mkdir()
+    cache.write_bytes(payload)
+    assert load_cached_yaml(yaml_file) == [{"id": "a"}]
+    assert pickle.loads(cache.read_bytes())[1] == [{"id": "a"}]
+
+
+def test_size_change_invalidates_cache(yaml_file):
+    load_cached_yaml(yaml_file)
+    mtime_ns = yaml_file.stat().st_mtime_ns
+    yaml_file.write_text("- id: ab\n")
+    # Same mtime (coarse filesystem clock); only the size tells the edit apart
+    os.utime(yaml_file, ns=(mtime_ns, mtime_ns))
+    assert load_cached_yaml(yaml_file) == [{"id": "ab"}]
@@ -0,0 +1,48 @@
+"""Parsed-YAML cache for the eval datasets.
+
+The golden/scenario files are parsed at collection time on every pytest run.
+The parsed data is pickled into __pycache__ next to the YAML file and reused
+until the file's mtime or size changes, the same way Python validates bytecode.
+"""
+
+import os
+import pickle
+from pathlib import Path
+
+import yaml
+
+# libyaml's C loader when PyYAML was built with it
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _cache_path(path: Path) -> Path:
+    return path.parent / "__pycache__" / f"{path.name}.pickle"
+
+
+def load_cached_yaml(path: Path):
+    """Load a YAML file, reusing the pickled parse while the file is unchanged."""
+    st = path.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    cache = _cache_path(path)
+    try:
+        with open(cache, "rb") as f:
+            cached_key, data = pickle.load(f)
+        if cached_key == key:
+            return data
+    except Exception:
+        # Missing, truncated, corrupt or foreign cache: reparse and rewrite it
+        pass
+
+    with open(path) as f:
+        data = yaml.load(f, Loader=_Loader)
+    try:
+        cache.parent.mkdir(exist_ok=True)
+        tmp = cache.with_name(f"{cache.name}.{os.getpid()}")
+        with open(tmp, "wb") as f:
+            pickle.dump((key, data), f, protocol=5)
+        # Atomic swap so a concurrent run never reads a half-written cache
+        os.replace(tmp, cache)
+    except OSError:
+        # Read-only checkout; the parse is still correct, just not cached
+        pass
+    return data
@@ -0,0 +1,156 @@
+"""Tests for agent construction and response post-processing."""
+
+import pytest
+from fastapi import BackgroundTasks
+from langchain_core.messages import AIMessage, AIMessageChunk, ToolMessage
+
+from app.agent import agent as agent_module
+from app.agent.models import DEFAULT_MODEL_ID, PROVIDER_KEY_AVAILABLE
+from app.clients.ghostfolio import RateLimitError
+from app.config import settings
+
+
+@pytest.fixture
+def empty_agent_cache(monkeypatch):
+    monkeypatch.setattr(settings, "groq_api_key", "test-key")
+    monkeypatch.setattr(agent_module, "_agent_cache", {})
+
+
+def test_get_agent_is_cached(empty_agent_cache):
+    assert agent_module.get_agent(DEFAULT_MODEL_ID) is agent_module.get_agent(DEFAULT_MODEL_ID)
+
+
+def test_get_agent_unknown_model_shares_default(empty_agent_cache):
+    default = agent_module.get_agent(DEFAULT_MODEL_ID)
+    assert agent_module.get_agent("not-a-model") is default
+    assert agent_module.get_agent("") is default
+    assert list(agent_module._agent_cache) == [DEFAULT_MODEL_ID]
+
+
+class FakeAgent:
+    """Stands in for the compiled LangGraph agent, replaying a fixed transcript."""
+
+    def __init__(self, messages):
+        self._messages = messages
+
+    async def ainvoke(self, inputs, config=None):
+        return {"messages": inputs["messages"] + self._messages}
+
+    async def astream(self, inputs, config=None, stream_mode=None):
+        messages = list(inputs["messages"])
+        yield "values", {"messages": list(messages)}
+        for msg in self._messages:
+            if isinstance(msg, Exception):
+                raise msg
+            if msg.type == "ai" and isinstance(msg.content, str):
+                for word in msg.content.split(" "):
+                    yield "messages", (AIMessageChunk(content=word + " "), {})
+            elif msg.type == "ai":
+                # Content blocks (Anthropic with tools bound) stream as block-list chunks
+                yield "messages", (AIMessageChunk(content=msg.content), {})
+            messages.append(msg)
+            yield "values", {"messages": list(messages)}
+
+
+@pytest.fixture
+def fake_agent(monkeypatch):
+    monkeypatch.setitem(PROVIDER_KEY_AVAILABLE, "groq", True)
+
+    def install(*messages):
+        monkeypatch.setattr(agent_module, "get_agent", lambda model_id: FakeAgent(list(messages)))
+
+    return install
+
+
+SUMMARY_OUTPUT = '{"total_value": 125000.5, "holdings_count": 4}'
+
+
+async def test_run_agent_verifies_inline(fake_agent):
+    fake_agent(
+        ToolMessage(content=SUMMARY_OUTPUT, name="portfolio_summary", tool_call_id="call-1"),
+        AIMessage(content="Your portfolio is worth $999,999.00."),
+    )
+    result = await agent_module.run_agent("show my portfolio")
+    assert result["tools_called"] == ["portfolio_summary"]
+    assert result["verification"]["numerical_consistent"] is False
+    assert result["verification"]["hallucination_detected"] is False
+
+
+async def test_run_agent_defers_verification(fake_agent):
+    fake_agent(
+        ToolMessage(content=SUMMARY_OUTPUT, name="portfolio_summary", tool_call_id="call-1"),
+        AIMessage(content="Your portfolio is worth $125,000.5."),
+    )
+    background_tasks = BackgroundTasks()
+    result = await agent_module.run_agent("show my portfolio", background_tasks=background_tasks)
+    assert "numerical_consistent" not in result["verification"]
+    assert "risk_warnings" in result["verification"]
+    assert len(background_tasks.tasks) == 1
+
+
+async def test_run_agent_skips_verification_without_tool_outputs(fake_agent, monkeypatch):
+    monkeypatch.setattr(agent_module, "_verify_response", lambda *args: pytest.fail("nothing to verify"))
+    fake_agent(AIMessage(content="Hi! A typical index fund costs $0.03 per $100 invested."))
+    result = await agent_module.run_agent("hello")
+    assert result["verification"]["numerical_consistent"] is True
+    assert result["verification"]["hallucination_detected"] is False
+
+    background_tasks = BackgroundTasks()
+    await agent_module.run_agent("hello", background_tasks=background_tasks)
+    assert background_tasks.tasks == []
+
+
+async def test_run_agent_collects_tools_and_usage(fake_agent):
+    fake_agent(
+        AIMessage(content="", response_metadata={"usage": {"input_tokens": 1000, "output_tokens": 100}}),
+        ToolMessage(content=SUMMARY_OUTPUT, name="portfolio_summary", tool_call_id="call-1"),
+        AIMessage(
+            content="Your portfolio holds 4 positions.",
+            response_metadata={"usage": {"prompt_tokens": 2000, "completion_tokens": 200}},
+        ),
+    )
+    result = await agent_module.run_agent("show my portfolio")
+    assert result["tools_called"] == ["portfolio_summary"]
+    assert result["response"].startswith("Your portfolio holds 4 positions.")
+    assert result["cost_usd"] == pytest.approx(3000 * 0.59e-6 + 300 * 0.79e-6, abs=1e-6)
+
+
+async def test_stream_agent_yields_tokens_then_result(fake_agent):
+    fake_agent(
+        ToolMessage(content=SUMMARY_OUTPUT, name="portfolio_summary", tool_call_id="call-1"),
+        AIMessage(content="Your portfolio holds 4 positions."),
+    )
+    events = [event async for event in agent_module.stream_agent("show my portfolio")]
+    tokens = "".join(e["content"] for e in events if e["type"] == "token")
+    assert tokens.strip() == "Your portfolio holds 4 positions."
+    assert [e["name"] for e in events if e["type"] == "tool"] == ["portfolio_summary"]
+    assert events[-1]["type"] == "done"
+    result = events[-1]["result"]
+    assert result["tools_called"] == ["portfolio_summary"]
+    assert result["response"].startswith("Your portfolio holds 4 positions.")
+
+
+async def test_stream_agent_yields_tokens_from_content_blocks(fake_agent):
+    fake_agent(AIMessage(content=[
+        {"type": "text", "text": "You hold 4 positions.", "index": 0},
+        {"type": "tool_use", "id": "call-1", "name": "portfolio_summary", "input": {}, "index": 1},
+    ]))
+    events = [event async for event in agent_module.stream_agent("show my portfolio")]
+    assert [e["content"] for e in events if e["type"] == "token"] == ["You hold 4 positions."]
+    assert events[-1]["result"]["response"].startswith("You hold 4 positions.")
+
+
+async def test_stream_agent_reports_errors_on_done(fake_agent):
+    fake_agent(RateLimitError(retry_after=12))
+    events = [event async for event in agent_module.stream_agent("show my portfolio")]
+    assert [e["type"] for e in events] == ["done"]
+    assert events[0]["result"]["error"] == "rate_limited"
+    assert events[0]["result"]["retry_after"] == 12
+
+
+async def test_run_agent_without_provider_key_skips_agent(monkeypatch):
+    monkeypatch.setitem(PROVIDER_KEY_AVAILABLE, "groq", False)
+    monkeypatch.setattr(agent_module, "get_agent", lambda model_id: pytest.fail("agent should not be built"))
+    result = await agent_module.run_agent("show my portfolio")
+    assert result["error"] == "no_api_key"
+    assert result["response"] == agent_module._NO_KEY_MESSAGE
@@ -1,72 +1,97 @@
 """Test the Ghostfolio API client with mocked HTTP responses."""
 
-import pytest
+from collections import OrderedDict
+from pathlib import Path
 
-from app.clients.ghostfolio import GhostfolioClient, _default_client, get_client, use_client
+import httpx
+import pytest
+import pytest_asyncio
+
+from app.clients import ghostfolio
+from app.clients.ghostfolio import (
+    GhostfolioClient,
+    _default_client,
+    close_shared_http,
+    create_anonymous_user,
+    get_client,
+    get_or_create_client,
+    use_client,
+    validate_access_token,
+)
+from tests.evals.expect import lookup
+from tests.evals.yaml_cache import load_cached_yaml
+
+CLIENT_CASES_PATH = Path(__file__).parent / "client_cases.yaml"
+
+CLIENT_CASES = load_cached_yaml(CLIENT_CASES_PATH)
+
+
+@pytest_asyncio.fixture(scope="module")
+async def shared_client():
+    """One client shared by the module, so its JWT and httpx pool are reused across tests."""
+    c = GhostfolioClient(access_token="test-token", base_url="http://localhost:3333")
+    yield c
+    await c.close()
 
 
 @pytest.fixture
-async def client(mock_ghostfolio):
+def client(mock_ghostfolio, shared_client):
+    # The bearer token from the first request is kept for the rest of the module
+    return shared_client
+
+
+@pytest_asyncio.fixture
+async def fresh_client(mock_ghostfolio):
+    """An unauthenticated client of its own, for tests that check auth state."""
     c = GhostfolioClient(access_token="test-token", base_url="http://localhost:3333")
     yield c
     await c.close()
 
 
-async def test_authenticate(client):
-    token = await client._authenticate()
+async def test_authenticate(fresh_client):
+    assert fresh_client._bearer_token is None
+    token = await fresh_client._authenticate()
     assert token == "mock-jwt-token"
-    assert client._bearer_token == "mock-jwt-token"
+    assert fresh_client._bearer_token == "mock-jwt-token"
 
 
-async def test_get_portfolio_details(client):
-    details = await client.get_portfolio_details()
-    assert "summary" in details
-    assert details["summary"]["currentValueInBaseCurrency"] == 125000.50
-    # holdings is a dict keyed by symbol
-    assert isinstance(details["holdings"], dict)
-    assert "VOO" in details["holdings"]
+@pytest.mark.parametrize("case", CLIENT_CASES, ids=[c["id"] for c in CLIENT_CASES])
+async def test_client_endpoint(client, case):
+    result = await getattr(client, case["method"])(**case.get("args", {}))
+    for path, expected in case.get("expect", {}).items():
+        assert lookup(result, path) == expected, path
+    for path, expected in case.get("expect_len", {}).items():
+        assert len(lookup(result, path)) == expected, path
 
 
-async def test_get_portfolio_performance(client):
-    perf = await client.get_portfolio_performance(date_range="max")
-    assert "performance" in perf
-    assert perf["performance"]["netPerformance"] == 25000.50
-    assert len(perf["chart"]) == 2
-
-
-async def test_get_holding_detail(client):
-    detail = await client.get_holding_detail("YAHOO", "AAPL")
-    assert detail["name"] == "Apple Inc."
-    assert detail["quantity"] == 153.4
+@pytest.fixture
+def empty_client_pool(monkeypatch):
+    """Give the test its own per-user client pool, dropped even if the test fails."""
+    monkeypatch.setattr(ghostfolio, "_client_pool", OrderedDict())
 
 
-async def test_get_accounts(client):
-    accounts = await client.get_accounts()
-    assert "accounts" in accounts
-    assert len(accounts["accounts"]) == 1
-    assert accounts["accounts"][0]["name"] == "Brokerage"
+async def test_validate_access_token(mock_ghostfolio):
+    token = await validate_access_token("test-token", base_url="http://localhost:3333")
+    assert token == "mock-jwt-token"
 
 
-async def test_get_orders(client):
-    orders = await client.get_orders()
-    assert "activities" in orders
-    assert len(orders["activities"]) == 3
+async def test_signup_bearer_handed_to_first_client(mock_ghostfolio, empty_client_pool):
+    mock_ghostfolio.post("/api/v1/user").mock(
+        return_value=httpx.Response(201, json={"accessToken": "new-access", "authToken": "new-jwt"})
+    )
+    result = await create_anonymous_user(base_url="http://localhost:3333")
+    assert result == {"access_token": "new-access", "auth_token": "new-jwt"}
+    client = await get_or_create_client("new-access")
+    assert client._bearer_token == "new-jwt"
+    assert not mock_ghostfolio["auth"].called
 
 
-async def test_create_order(client):
-    order = {
-        "accountId": "acc-1",
-        "symbol": "TSLA",
-        "quantity": 5,
-        "unitPrice": 250,
-        "type": "BUY",
-        "currency": "USD",
-        "dataSource": "YAHOO",
-        "date": "2025-01-01T00:00:00.000Z",
-        "fee": 0,
-    }
-    result = await client.create_order(order)
-    assert result["id"] == "order-new-1"
+async def test_get_or_create_client_reuses_pooled_client(mock_ghostfolio, empty_client_pool):
+    first = await get_or_create_client("pooled-token")
+    second = await get_or_create_client("pooled-token")
+    assert first is second
+    assert first._bearer_token == "mock-jwt-token"
+    assert mock_ghostfolio["auth"].call_count == 1
 
 
 # ── Context var tests ────────────────────────────────────────────────
@@ -76,7 +101,7 @@ def test_get_client_returns_default():
     assert get_client() is _default_client
 
 
-async def test_use_client_overrides(mock_ghostfolio):
+async def test_use_client_overrides():
     """use_client() context manager sets and resets the active client."""
     custom = GhostfolioClient(access_token="custom-token", base_url="http://localhost:3333")
     with use_client(custom):
@@ -86,6 +111,25 @@ async def test_use_client_overrides(mock_ghostfolio):
     await custom.close()
 
 
+async def test_shared_pool_survives_close(mock_ghostfolio):
+    """Clients on the shared pool leave its connections open when closed."""
+    c = GhostfolioClient(access_token="test-token", base_url="http://localhost:3333", shared_pool=True)
+    await c.get_accounts()
+    await c.close()
+    assert not c._client.is_closed
+
+
+async def test_pooled_client_usable_after_shared_pool_closed(mock_ghostfolio):
+    """Closing the shared pool (app shutdown) swaps in a fresh one for a restarted lifespan."""
+    c = GhostfolioClient(access_token="test-token", base_url="http://localhost:3333", shared_pool=True)
+    before = c._client
+    await close_shared_http()
+    assert before.is_closed
+    result = await c.get_accounts()
+    assert result["accounts"][0]["name"] == "Brokerage"
+    assert await validate_access_token("test-token", base_url="http://localhost:3333") == "mock-jwt-token"
+
+
 def test_parametrized_constructor():
     """GhostfolioClient accepts explicit access_token and base_url."""
     c = GhostfolioClient(access_token="my-token", base_url="http://example.com:3333/")
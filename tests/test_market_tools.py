@@ -1,29 +1,27 @@
 """Tests for market data tools with mocked yfinance."""
 
 import json
+from types import MappingProxyType
 
-import pandas as pd
 import pytest
-import yfinance
 
 # ── stock_price ──────────────────────────────────────────────
 
 
 @pytest.mark.asyncio
 async def test_stock_price_returns_price(monkeypatch):
-    class FakeFastInfo:
-        def get(self, key, default=None):
-            return {
-                "lastPrice": 195.50, "previousClose": 190.0,
-                "open": 191.0, "dayHigh": 196.0, "dayLow": 189.5,
-                "currency": "USD",
-            }.get(key, default)
+    # fast_info only needs .get(); a read-only mapping provides it without a wrapper class
+    fast_info = MappingProxyType({
+        "lastPrice": 195.50, "previousClose": 190.0,
+        "open": 191.0, "dayHigh": 196.0, "dayLow": 189.5,
+        "currency": "USD",
+    })
 
     class FakeTicker:
         def __init__(self, symbol):
-            self.fast_info = FakeFastInfo()
+            self.fast_info = fast_info
 
-    monkeypatch.setattr(yfinance, "Ticker", FakeTicker)
+    monkeypatch.setattr("yfinance.Ticker", FakeTicker)
 
     from app.agent.tools.stock_price import stock_price
     result = json.loads(await stock_price.ainvoke({"symbol": "AAPL"}))
@@ -39,7 +37,7 @@ async def test_stock_price_error_handling(monkeypatch):
     def bad_ticker(symbol):
         raise ValueError("No data")
 
-    monkeypatch.setattr(yfinance, "Ticker", bad_ticker)
+    monkeypatch.setattr("yfinance.Ticker", bad_ticker)
 
     from app.agent.tools.stock_price import stock_price
     result = json.loads(await stock_price.ainvoke({"symbol": "INVALID"}))
@@ -50,21 +48,15 @@ async def test_stock_price_error_handling(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_stock_trend_weekly(monkeypatch):
-    dates = pd.date_range("2025-02-24", periods=5, freq="D")
-    fake_hist = pd.DataFrame({
-        "Close": [100.0, 102.0, 101.0, 103.0, 105.0],
-        "Volume": [1000, 1200, 900, 1100, 1500],
-    }, index=dates)
-
+async def test_stock_trend_weekly(monkeypatch, fake_hist_frames):
     class FakeTicker:
         def __init__(self, symbol):
             pass
 
         def history(self, period=None, interval=None):
-            return fake_hist
+            return fake_hist_frames["weekly"]
 
-    monkeypatch.setattr(yfinance, "Ticker", FakeTicker)
+    monkeypatch.setattr("yfinance.Ticker", FakeTicker)
 
     from app.agent.tools.stock_trend import stock_trend
     result = json.loads(await stock_trend.ainvoke({"symbol": "AAPL", "period": "1w"}))
@@ -77,15 +69,15 @@ async def test_stock_trend_weekly(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_stock_trend_empty_data(monkeypatch):
+async def test_stock_trend_empty_data(monkeypatch, fake_hist_frames):
     class FakeTicker:
         def __init__(self, symbol):
             pass
 
         def history(self, period=None, interval=None):
-            return pd.DataFrame()
+            return fake_hist_frames["empty"]
 
-    monkeypatch.setattr(yfinance, "Ticker", FakeTicker)
+    monkeypatch.setattr("yfinance.Ticker", FakeTicker)
 
     from app.agent.tools.stock_trend import stock_trend
     result = json.loads(await stock_trend.ainvoke({"symbol": "FAKE"}))
@@ -97,27 +89,34 @@ async def test_stock_trend_empty_data(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_sector_performance(monkeypatch):
+    import numpy as np
+    import pandas as pd
+
     from app.agent.tools.sector_performance import SECTOR_ETFS
 
+    # One (sector, [start, end]) close array and one index shared by every fake ticker
     dates = pd.date_range("2025-02-24", periods=2, freq="D")
+    changes = np.array([3.0, 2.0, 1.5, 1.0, 0.5, -0.5, -1.0, -1.5, -2.0, -2.5, -3.0])
+    start = 100.0
+    closes = np.column_stack((np.full_like(changes, start), start * (1 + changes / 100)))
 
     class FakeIndividualTicker:
-        def __init__(self, change_pct):
-            start = 100.0
-            end = start * (1 + change_pct / 100)
-            self._hist = pd.DataFrame({"Close": [start, end]}, index=dates)
+        __slots__ = ("_row",)
+
+        def __init__(self, row):
+            self._row = row
 
         def history(self, period=None):
-            return self._hist
+            return pd.DataFrame({"Close": self._row}, index=dates)
+
+    # ETFs pair with close rows in SECTOR_ETFS order
+    tickers = dict(zip(SECTOR_ETFS.values(), map(FakeIndividualTicker, closes)))
 
     class FakeTickers:
         def __init__(self, symbols_str):
-            self.tickers = {}
-            changes = [3.0, 2.0, 1.5, 1.0, 0.5, -0.5, -1.0, -1.5, -2.0, -2.5, -3.0]
-            for i, etf in enumerate(SECTOR_ETFS.values()):
-                self.tickers[etf] = FakeIndividualTicker(changes[i])
+            self.tickers = tickers
 
-    monkeypatch.setattr(yfinance, "Tickers", FakeTickers)
+    monkeypatch.setattr("yfinance.Tickers", FakeTickers)
 
     from app.agent.tools.sector_performance import sector_performance
     result = json.loads(await sector_performance.ainvoke({"period": "1w"}))
@@ -134,34 +133,18 @@ async def test_sector_performance(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_stock_volume(monkeypatch):
-    dates_5d = pd.date_range("2025-02-24", periods=5, freq="D")
-    fake_hist = pd.DataFrame({
-        "Open": [100, 102, 101, 103, 104],
-        "Close": [102, 101, 103, 104, 106],
-        "Volume": [1000000, 1200000, 900000, 1100000, 1500000],
-    }, index=dates_5d)
-
-    dates_30d = pd.date_range("2025-02-01", periods=20, freq="D")
-    fake_30d = pd.DataFrame({
-        "Open": [100] * 20,
-        "Close": [102] * 20,
-        "Volume": [1000000] * 20,
-    }, index=dates_30d)
-
-    call_count = {"n": 0}
+async def test_stock_volume(monkeypatch, fake_hist_frames):
+    # The tool asks for the week first, then the month for its average
+    hist_iter = iter((fake_hist_frames["vol_5d"], fake_hist_frames["vol_30d"]))
 
     class FakeTicker:
         def __init__(self, symbol):
             pass
 
         def history(self, period=None):
-            call_count["n"] += 1
-            if call_count["n"] == 1:
-                return fake_hist
-            return fake_30d
+            return next(hist_iter)
 
-    monkeypatch.setattr(yfinance, "Ticker", FakeTicker)
+    monkeypatch.setattr("yfinance.Ticker", FakeTicker)
 
     from app.agent.tools.stock_volume import stock_volume
     result = json.loads(await stock_volume.ainvoke({"symbol": "AAPL"}))
@@ -173,15 +156,15 @@ async def test_stock_volume(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_stock_volume_empty(monkeypatch):
+async def test_stock_volume_empty(monkeypatch, fake_hist_frames):
     class FakeTicker:
         def __init__(self, symbol):
             pass
 
         def history(self, period=None):
-            return pd.DataFrame()
+            return fake_hist_frames["empty"]
 
-    monkeypatch.setattr(yfinance, "Ticker", FakeTicker)
+    monkeypatch.setattr("yfinance.Ticker", FakeTicker)
 
     from app.agent.tools.stock_volume import stock_volume
     result = json.loads(await stock_volume.ainvoke({"symbol": "FAKE"}))
@@ -1,9 +1,12 @@
 """Tests for the memory bank store."""
 
-import time
+import importlib
 
 from app.memory.memory_store import MemoryStore
 
+# app.memory re-exports the memory_store instance under the module's name, so fetch the module itself
+memory_store_module = importlib.import_module("app.memory.memory_store")
+
 
 def _fresh_store() -> MemoryStore:
     return MemoryStore()
@@ -89,12 +92,14 @@ def test_cache_miss():
     assert store.get_cached_fact("user1", "portfolio_summary") is None
 
 
-def test_cache_ttl_expiry():
+def test_cache_ttl_expiry(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(memory_store_module, "_now", lambda: clock[0])
     store = _fresh_store()
     store.FACT_TTL_SECONDS = 1
     store.cache_fact("user1", "portfolio_summary", '{"value": 100}')
     assert store.get_cached_fact("user1", "portfolio_summary") is not None
-    time.sleep(1.1)
+    clock[0] += 2
     assert store.get_cached_fact("user1", "portfolio_summary") is None
 
 
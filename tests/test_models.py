@@ -0,0 +1,27 @@
+"""Tests for the LLM model registry."""
+
+from app.agent.models import (
+    DEFAULT_MODEL_ID,
+    PROVIDER_KEY_AVAILABLE,
+    SUPPORTED_MODELS,
+    available_models,
+    get_model_spec,
+)
+
+
+def test_get_model_spec_known():
+    assert get_model_spec("gpt-4o").provider == "openai"
+
+
+def test_get_model_spec_unknown_falls_back_to_default():
+    assert get_model_spec("not-a-model").model_id == DEFAULT_MODEL_ID
+
+
+def test_available_models_lists_every_model():
+    models = available_models()
+    assert [m["model_id"] for m in models] == list(SUPPORTED_MODELS)
+    assert all(m["available"] is PROVIDER_KEY_AVAILABLE[m["provider"]] for m in models)
+
+
+def test_available_models_is_cached():
+    assert available_models() is available_models()
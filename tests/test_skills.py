@@ -1,62 +1,32 @@
 """Tests for skill-based intent classification."""
 
-from app.agent.skills import SKILLS, classify_intent
-
-
-def test_classify_portfolio_analysis():
-    assert classify_intent("show me my portfolio summary").name == "portfolio_analysis"
-
-
-def test_classify_portfolio_holdings():
-    assert classify_intent("what are my holdings?").name == "portfolio_analysis"
-
-
-def test_classify_portfolio_value():
-    assert classify_intent("what is my total portfolio value?").name == "portfolio_analysis"
-
-
-def test_classify_performance_tracking():
-    assert classify_intent("how did my portfolio perform this year?").name == "performance_tracking"
-
-
-def test_classify_performance_returns():
-    assert classify_intent("show me my returns for ytd").name == "performance_tracking"
-
-
-def test_classify_trade_execution_buy():
-    assert classify_intent("I bought 10 shares of AAPL at $230").name == "trade_execution"
-
-
-def test_classify_trade_execution_sell():
-    assert classify_intent("sell 5 shares of MSFT").name == "trade_execution"
-
-
-def test_classify_risk_assessment():
-    assert classify_intent("how is my diversification?").name == "risk_assessment"
-
+import pytest
 
-def test_classify_risk_concentration():
-    assert classify_intent("do I have concentration risk?").name == "risk_assessment"
-
-
-def test_classify_research_search():
-    assert classify_intent("search for Apple stock").name == "research"
-
-
-def test_classify_research_dividend():
-    assert classify_intent("show dividend history for VOO").name == "research"
-
-
-def test_classify_research_transactions():
-    assert classify_intent("show my transactions").name == "research"
-
-
-def test_classify_fallback():
-    assert classify_intent("hello there").name == "portfolio_analysis"
+from app.agent.skills import SKILLS, classify_intent
 
 
-def test_classify_empty_string():
-    assert classify_intent("").name == "portfolio_analysis"
+@pytest.mark.parametrize("query,expected", [
+    pytest.param("show me my portfolio summary", "portfolio_analysis", id="portfolio_analysis"),
+    pytest.param("what are my holdings?", "portfolio_analysis", id="portfolio_holdings"),
+    pytest.param("what is my total portfolio value?", "portfolio_analysis", id="portfolio_value"),
+    pytest.param("how did my portfolio perform this year?", "performance_tracking", id="performance_tracking"),
+    pytest.param("show me my returns for ytd", "performance_tracking", id="performance_returns"),
+    pytest.param("I bought 10 shares of AAPL at $230", "trade_execution", id="trade_execution_buy"),
+    pytest.param("sell 5 shares of MSFT", "trade_execution", id="trade_execution_sell"),
+    pytest.param("how is my diversification?", "risk_assessment", id="risk_assessment"),
+    pytest.param("do I have concentration risk?", "risk_assessment", id="risk_concentration"),
+    pytest.param("search for Apple stock", "research", id="research_search"),
+    pytest.param("show dividend history for VOO", "research", id="research_dividend"),
+    pytest.param("show my transactions", "research", id="research_transactions"),
+    pytest.param("hello there", "portfolio_analysis", id="fallback"),
+    pytest.param("", "portfolio_analysis", id="empty_string"),
+    pytest.param("what is the current price of AAPL", "market_data", id="market_data_price"),
+    pytest.param("show me the trend for MSFT this week", "market_data", id="market_data_trend"),
+    pytest.param("show me sectors doing today", "market_data", id="market_data_sector"),
+    pytest.param("show me the trading volume for TSLA", "market_data", id="market_data_volume"),
+])
+def test_classify(query, expected):
+    assert classify_intent(query).name == expected
 
 
 def test_all_skills_have_required_fields():
@@ -68,22 +38,6 @@ def test_all_skills_have_required_fields():
         assert len(skill.prompt_addon) > 0
 
 
-def test_classify_market_data_price():
-    assert classify_intent("what is the current price of AAPL").name == "market_data"
-
-
-def test_classify_market_data_trend():
-    assert classify_intent("show me the trend for MSFT this week").name == "market_data"
-
-
-def test_classify_market_data_sector():
-    assert classify_intent("show me sectors doing today").name == "market_data"
-
-
-def test_classify_market_data_volume():
-    assert classify_intent("show me the trading volume for TSLA").name == "market_data"
-
-
 def test_trade_has_highest_priority():
     trade = SKILLS["trade_execution"]
     for name, skill in SKILLS.items():
@@ -0,0 +1,32 @@
+"""Test tracing setup without contacting LangSmith or Langfuse."""
+
+import pytest
+
+from app.tracing import setup
+
+
+@pytest.fixture
+def langfuse_keys(monkeypatch):
+    monkeypatch.setattr(setup.settings, "langchain_api_key", "")
+    monkeypatch.setattr(setup.settings, "langfuse_secret_key", "sk-test")
+    monkeypatch.setattr(setup.settings, "langfuse_public_key", "pk-test")
+    # init_tracing() writes LANGCHAIN_TRACING_V2; have monkeypatch restore it
+    monkeypatch.delenv("LANGCHAIN_TRACING_V2", raising=False)
+    monkeypatch.setattr(setup, "_initialized", False)
+    monkeypatch.setattr(setup, "langfuse_client", None)
+
+
+def test_failed_init_can_be_retried(monkeypatch, langfuse_keys):
+    def broken_langfuse(**kwargs):
+        raise RuntimeError("langfuse unavailable")
+
+    monkeypatch.setattr(setup, "Langfuse", broken_langfuse)
+    with pytest.raises(RuntimeError):
+        setup.init_tracing()
+    assert setup._initialized is False
+
+    client = object()
+    monkeypatch.setattr(setup, "Langfuse", lambda **kwargs: client)
+    setup.init_tracing()
+    assert setup._initialized is True
+    assert setup.langfuse_client is client